@@ -25,6 +25,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 from pathlib import Path
@@ -37,22 +38,34 @@ try:
 except ModuleNotFoundError as exc:  # pragma: no cover - safety net for minimal envs
     raise RuntimeError("PyYAML is required to run parse_antismash.py") from exc
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "config" / "pipeline_defaults.yaml"
 TOOL_NAME = "antismash"
 
+_NUMERIC_COLUMNS = frozenset({"ClusterIndex", "Start", "End", "Score"})
+_LIST_COLUMNS = frozenset({"CoreEnzymes", "MIBiGHits"})
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config(target: Path) -> Dict[str, Any]:
+    with target.open("r", encoding="utf-8") as fh:
+        config = yaml.load(fh, Loader=_YAML_LOADER)
+    if not isinstance(config, dict):
+        raise ValueError(f"Configuration malformed (expected dict): {target}")
+    return config
+
 
 def load_config(config_path: Path | None) -> Dict[str, Any]:
     """Load pipeline configuration with a fallback to the default YAML file."""
     target = config_path or DEFAULT_CONFIG
     if not target.exists():
         raise FileNotFoundError(f"Configuration file not found: {target}")
-    with target.open("r", encoding="utf-8") as fh:
-        config = yaml.safe_load(fh)
-    if not isinstance(config, dict):
-        raise ValueError(f"Configuration malformed (expected dict): {target}")
-    return config
+    # Parsed once per resolved path; callers treat the result as read-only
+    return _read_config(target.resolve())
 
 
 def _iter_clusters(records: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
@@ -85,51 +98,72 @@ def parse_antismash_file(input_path: Path) -> pd.DataFrame:
     if records is None:
         raise ValueError("antiSMASH JSON missing 'records' key")
 
-    rows: List[Dict[str, Any]] = []
+    # Column-oriented: one list per field rather than a dict per cluster
+    sample_ids: List[Any] = []
+    cluster_index: List[Any] = []
+    cluster_type: List[str] = []
+    start: List[Any] = []
+    end: List[Any] = []
+    score: List[Any] = []
+    core_enzymes: List[Any] = []
+    mibig_hits: List[Any] = []
     for sample_id, cluster in _iter_clusters(records):
-        rows.append(
-            {
-                "SampleID": sample_id,
-                "Tool": TOOL_NAME,
-                "ClusterIndex": cluster.get("cluster_id"),
-                "ClusterType": ",".join(cluster.get("type", [])),
-                "Start": cluster.get("start"),
-                "End": cluster.get("end"),
-                "Score": cluster.get("score"),
-                "CoreEnzymes": cluster.get("core_genes", []),
-                "MIBiGHits": cluster.get("mibig_hits", []),
-            }
-        )
-
-    frame = pd.DataFrame(rows)
+        sample_ids.append(sample_id)
+        cluster_index.append(cluster.get("cluster_id"))
+        cluster_type.append(",".join(cluster.get("type", [])))
+        start.append(cluster.get("start"))
+        end.append(cluster.get("end"))
+        score.append(cluster.get("score"))
+        core_enzymes.append(cluster.get("core_genes", []))
+        mibig_hits.append(cluster.get("mibig_hits", []))
+
+    frame = pd.DataFrame(
+        {
+            "SampleID": sample_ids,
+            "Tool": TOOL_NAME,
+            "ClusterIndex": cluster_index,
+            "ClusterType": cluster_type,
+            "Start": start,
+            "End": end,
+            "Score": score,
+            "CoreEnzymes": pd.Series(core_enzymes, dtype=object),
+            "MIBiGHits": pd.Series(mibig_hits, dtype=object),
+        }
+    )
     logger.debug("Parsed %d clusters from %s", len(frame), input_path)
     return frame
 
 
 def sanitize_records(records: pd.DataFrame, schema_columns: List[str]) -> pd.DataFrame:
     """Clean and standardize field names, types, and missing values."""
-    df = records.copy()
-
+    # Build each output column once, in schema order, instead of copying and patching the frame
+    columns: Dict[str, Any] = {}
     for col in schema_columns:
-        if col not in df.columns:
-            df[col] = pd.NA
+        if col == "Tool":
+            columns[col] = TOOL_NAME
+            continue
+        if col in records.columns:
+            values = records[col]
+        else:
+            values = pd.Series(pd.NA, index=records.index, dtype=object)
             logger.debug("Added missing column %s with NA defaults", col)
-
-    df["Tool"] = TOOL_NAME
-    df["ClusterIndex"] = pd.to_numeric(df["ClusterIndex"], errors="coerce")
-    df["Start"] = pd.to_numeric(df["Start"], errors="coerce")
-    df["End"] = pd.to_numeric(df["End"], errors="coerce")
-    df["Score"] = pd.to_numeric(df["Score"], errors="coerce")
-
-    list_columns = {"CoreEnzymes", "MIBiGHits"}
-    for col in list_columns:
-        df[col] = df[col].apply(lambda value: value if isinstance(value, list) else [])
+        if col in _NUMERIC_COLUMNS:
+            values = pd.to_numeric(values, errors="coerce")
+        elif col in _LIST_COLUMNS:
+            values = pd.Series(
+                [value if isinstance(value, list) else [] for value in values],
+                index=records.index,
+                dtype=object,
+            )
+        columns[col] = values
+
+    df = pd.DataFrame(columns, index=records.index, columns=schema_columns)
 
     missing_sample = df["SampleID"].isna().sum()
     if missing_sample:
         logger.warning("Found %d records without SampleID", missing_sample)
 
-    return df.loc[:, schema_columns]
+    return df
 
 
 def write_output(df: pd.DataFrame, output_path: Path) -> None:
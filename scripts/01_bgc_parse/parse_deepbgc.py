@@ -24,43 +24,84 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pandas as pd
 
+try:  # pragma: no cover - pyarrow optional, pandas reader fallback
+    import pyarrow.csv as pacsv
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover
+    pacsv = None  # type: ignore
+    _HAS_PYARROW = False
+
 try:
     import yaml
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise RuntimeError("PyYAML is required to run parse_deepbgc.py") from exc
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "config" / "pipeline_defaults.yaml"
 TOOL_NAME = "deepbgc"
 
+_NUMERIC_COLUMNS = frozenset({"ClusterIndex", "Start", "End", "Score"})
+_LIST_COLUMNS = frozenset({"CoreEnzymes", "MIBiGHits"})
 
-def load_config(config_path: Path | None) -> Dict[str, Any]:
-    target = config_path or DEFAULT_CONFIG
-    if not target.exists():
-        raise FileNotFoundError(f"Configuration file not found: {target}")
+
+@functools.lru_cache(maxsize=4)
+def _read_config(target: Path) -> Dict[str, Any]:
     with target.open("r", encoding="utf-8") as fh:
-        config = yaml.safe_load(fh)
+        config = yaml.load(fh, Loader=_YAML_LOADER)
     if not isinstance(config, dict):
         raise ValueError(f"Configuration malformed (expected dict): {target}")
     return config
 
 
+def load_config(config_path: Path | None) -> Dict[str, Any]:
+    target = config_path or DEFAULT_CONFIG
+    if not target.exists():
+        raise FileNotFoundError(f"Configuration file not found: {target}")
+    # Parsed once per resolved path; callers treat the result as read-only
+    return _read_config(target.resolve())
+
+
+# pandas' default NA markers, passed to both readers so they agree on what is missing
+_NA_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+)
+
+
+def _read_delimited(path: Path, sep: str) -> pd.DataFrame:
+    """Read a UTF-8 delimited table with pyarrow's multithreaded parser when available."""
+    if not _HAS_PYARROW:
+        return pd.read_csv(path, sep=sep, encoding="utf-8", keep_default_na=False, na_values=list(_NA_VALUES))
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(encoding="utf8"),
+        parse_options=pacsv.ParseOptions(delimiter=sep),
+        # strings_can_be_null: text columns honour the NA markers too, as in pandas
+        convert_options=pacsv.ConvertOptions(null_values=list(_NA_VALUES), strings_can_be_null=True),
+    )
+    return table.to_pandas()
+
+
 def parse_deepbgc_file(input_path: Path) -> pd.DataFrame:
     """Parse DeepBGC output into the core schema."""
     if not input_path.exists():
         raise FileNotFoundError(f"DeepBGC file not found: {input_path}")
 
     if input_path.suffix.lower() in {".tsv", ".txt"}:
-        df = pd.read_csv(input_path, sep="	")
+        df = _read_delimited(input_path, "\t")
     elif input_path.suffix.lower() == ".csv":
-        df = pd.read_csv(input_path)
+        df = _read_delimited(input_path, ",")
     else:
         raise NotImplementedError(
             f"Unsupported DeepBGC format: {input_path.suffix}. Use TSV or CSV exports."
@@ -99,23 +140,30 @@ def parse_deepbgc_file(input_path: Path) -> pd.DataFrame:
 
 def sanitize_records(records: pd.DataFrame, schema_columns: List[str]) -> pd.DataFrame:
     """Normalize column names, data types, and missing values."""
-    df = records.copy()
+    # Build each output column once, in schema order, instead of copying and patching the frame
+    columns: Dict[str, Any] = {}
     for col in schema_columns:
-        if col not in df.columns:
-            df[col] = pd.NA
+        if col == "Tool":
+            columns[col] = TOOL_NAME
+            continue
+        if col in records.columns:
+            values = records[col]
+        else:
+            values = pd.Series(pd.NA, index=records.index, dtype=object)
             logger.debug("Added missing column %s with NA defaults", col)
-
-    df["Tool"] = TOOL_NAME
-    df["ClusterIndex"] = pd.to_numeric(df["ClusterIndex"], errors="coerce")
-    df["Start"] = pd.to_numeric(df["Start"], errors="coerce")
-    df["End"] = pd.to_numeric(df["End"], errors="coerce")
-    df["Score"] = pd.to_numeric(df["Score"], errors="coerce")
-
-    list_columns = {"CoreEnzymes", "MIBiGHits"}
-    for col in list_columns:
-        df[col] = df[col].apply(lambda value: value if isinstance(value, list) else [])
-
-    return df.loc[:, schema_columns]
+        if col in _NUMERIC_COLUMNS:
+            values = pd.to_numeric(values, errors="coerce")
+        elif col in _LIST_COLUMNS:
+            values = pd.Series(
+                [value if isinstance(value, list) else [] for value in values],
+                index=records.index,
+                dtype=object,
+            )
+        columns[col] = values
+
+    df = pd.DataFrame(columns, index=records.index, columns=schema_columns)
+
+    return df
 
 
 def write_output(df: pd.DataFrame, output_path: Path) -> None:
@@ -26,12 +26,28 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:  # pragma: no cover - pyarrow optional, pandas reader fallback
+    import pyarrow.csv as pacsv
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover
+    pacsv = None  # type: ignore
+    _HAS_PYARROW = False
+
+try:  # pragma: no cover - polars optional, numpy path is the reference
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:  # pragma: no cover
+    pl = None  # type: ignore
+    _HAS_POLARS = False
+
 try:
     import yaml
 except ModuleNotFoundError as exc:  # pragma: no cover
@@ -55,14 +71,42 @@ def load_config(config_path: Path | None) -> Dict[str, Any]:
     return config
 
 
-def load_features(input_path: Path, column_map: Dict[str, str]) -> pd.DataFrame:
-    if not input_path.exists():
+# pandas' default NA markers, passed to both readers so they agree on what is missing
+_NA_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+)
+
+
+def _read_delimited(path: Path, sep: str) -> pd.DataFrame:
+    """Read a UTF-8 delimited table with pyarrow's multithreaded parser when available."""
+    if not _HAS_PYARROW:
+        return pd.read_csv(path, sep=sep, encoding="utf-8", keep_default_na=False, na_values=list(_NA_VALUES))
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(encoding="utf8"),
+        parse_options=pacsv.ParseOptions(delimiter=sep),
+        # strings_can_be_null: text columns honour the NA markers too, as in pandas
+        convert_options=pacsv.ConvertOptions(null_values=list(_NA_VALUES), strings_can_be_null=True),
+    )
+    return table.to_pandas()
+
+
+@functools.lru_cache(maxsize=32)
+def _inverse_map(items: Tuple[Tuple[str, str | None], ...]) -> Dict[str, str]:
+    """Source-column -> schema-column rename map, built once per distinct column map."""
+    return {source: target for target, source in items if source is not None}
+
+
+def load_features(input_path: Path | pd.DataFrame, column_map: Dict[str, str]) -> pd.DataFrame:
+    if isinstance(input_path, pd.DataFrame):
+        df = input_path
+    elif not input_path.exists():
         raise FileNotFoundError(f"Feature table not found: {input_path}")
+    else:
+        df = _read_delimited(input_path, ",")
 
-    df = pd.read_csv(input_path)
-    rename_dict = {column_map.get(key, key): key for key in ["FeatureID", "mz", "rt", "intensity", "SampleID"] if column_map.get(key)}
-    inverted_map = {column_map[key]: key for key in column_map if column_map[key] is not None}
-    df = df.rename(columns=inverted_map)
+    df = df.rename(columns=_inverse_map(tuple(column_map.items())))
 
     missing = [col for col in ["FeatureID", "mz", "rt", "intensity"] if col not in df.columns]
     if missing:
@@ -80,34 +124,81 @@ def load_features(input_path: Path, column_map: Dict[str, str]) -> pd.DataFrame:
     return df
 
 
+def _clip_norm_numpy(
+    intensity: np.ndarray,
+    sample_codes: np.ndarray,
+    n_samples: int,
+    intensity_floor: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Clip ``intensity`` in place and return (clipped, normalized, per-row sample TIC)."""
+    intensity[np.isnan(intensity)] = 0.0
+    np.maximum(intensity, 0.0, out=intensity)
+    if intensity_floor > 0:
+        below_floor = intensity < intensity_floor
+        if below_floor.any():
+            logger.debug("Applying intensity floor to %d rows", below_floor.sum())
+        intensity[below_floor] = intensity_floor
+
+    # Per-sample TIC: one bincount for the totals, then broadcast back by sample code
+    totals = np.bincount(sample_codes, weights=intensity, minlength=n_samples)
+    row_totals = totals[sample_codes]
+    normalized = np.divide(intensity, row_totals, out=np.zeros_like(intensity), where=row_totals > 0)
+    return intensity, normalized, row_totals
+
+
+def _clip_norm_polars(
+    intensity: np.ndarray,
+    sample_codes: np.ndarray,
+    intensity_floor: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Polars twin of :func:`_clip_norm_numpy`; only the numeric columns cross the boundary."""
+    intensity_col = pl.col("intensity")
+    out = (
+        pl.DataFrame({"intensity": intensity, "sample": sample_codes})
+        .lazy()
+        .with_columns(intensity_col.fill_nan(0.0).fill_null(0.0).clip(lower_bound=max(intensity_floor, 0.0)))
+        .with_columns(tic=intensity_col.sum().over("sample"))
+        .with_columns(
+            intensity_normalized=pl.when(pl.col("tic") > 0).then(intensity_col / pl.col("tic")).otherwise(0.0)
+        )
+        .collect()
+    )
+    return (
+        out["intensity"].to_numpy(),
+        out["intensity_normalized"].to_numpy(),
+        out["tic"].to_numpy(),
+    )
+
+
 def clip_and_normalize(
     df: pd.DataFrame,
     intensity_floor: float,
     method: str,
+    engine: str = "numpy",
 ) -> pd.DataFrame:
-    data = df.copy()
-    data["intensity_raw"] = data["intensity"]
-    data["intensity"] = data["intensity"].fillna(0).clip(lower=0)
-    if intensity_floor > 0:
-        below_floor = data["intensity"] < intensity_floor
-        if below_floor.any():
-            logger.debug("Applying intensity floor to %d rows", below_floor.sum())
-        data.loc[below_floor, "intensity"] = intensity_floor
-
-    if method.lower() == "tic":
-        normalized = []
-        for sample_id, group in data.groupby("SampleID"):
-            total = group["intensity"].sum()
-            if total <= 0:
-                logger.warning("Sample %s has non-positive total intensity; skipping normalization", sample_id)
-                normalized.extend([0.0] * len(group))
-            else:
-                normalized.extend((group["intensity"] / total).tolist())
-        data["intensity_normalized"] = normalized
-    else:
+    if method.lower() != "tic":
         raise NotImplementedError(f"Normalization method '{method}' not implemented")
+    use_polars = engine.lower() == "polars"
+    if use_polars and not _HAS_POLARS:
+        logger.warning("Polars not installed; falling back to the numpy normalization engine")
+        use_polars = False
 
-    return data
+    intensity = df["intensity"].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    sample_codes, sample_ids = pd.factorize(df["SampleID"], use_na_sentinel=False)
+
+    if use_polars:
+        intensity, normalized, row_totals = _clip_norm_polars(intensity, sample_codes, intensity_floor)
+    else:
+        intensity, normalized, row_totals = _clip_norm_numpy(intensity, sample_codes, len(sample_ids), intensity_floor)
+    totals = np.zeros(len(sample_ids))
+    totals[sample_codes] = row_totals
+    for sample_id in sample_ids[totals <= 0]:
+        logger.warning("Sample %s has non-positive total intensity; skipping normalization", sample_id)
+
+    processed = df.assign(intensity_raw=df["intensity"], intensity=intensity, intensity_normalized=normalized)
+    # Per-sample TIC denominators, keyed by str(SampleID), so QC never re-sums the intensities
+    processed.attrs["tic_total"] = {str(sample_id): float(total) for sample_id, total in zip(sample_ids, totals)}
+    return processed
 
 
 def validate_schema(df: pd.DataFrame) -> None:
@@ -115,6 +206,16 @@ def validate_schema(df: pd.DataFrame) -> None:
     if missing:
         raise ValueError(f"Normalized table missing required columns: {missing}")
 
+    tic_totals = df.attrs.get("tic_total")
+    if tic_totals is not None:
+        # Each sample with a positive TIC contributes exactly 1.0 to the normalized sum
+        expected = sum(1 for total in tic_totals.values() if total > 0)
+        observed = float(df["intensity_normalized"].sum())
+        if abs(observed - expected) > 1e-6 * max(expected, 1):
+            raise ValueError(
+                f"Normalized intensities sum to {observed:.6g}, expected {expected} (one per sample with TIC > 0)"
+            )
+
 
 def write_output(df: pd.DataFrame, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -168,7 +269,8 @@ def main(argv: List[str] | None = None) -> None:
     ms_config = config.get("ms_processing", {})
     floor = float(ms_config.get("intensity_floor", 0))
     method = ms_config.get("normalization", "tic")
-    processed = clip_and_normalize(raw, floor, method)
+    engine = ms_config.get("engine", "numpy")
+    processed = clip_and_normalize(raw, floor, method, engine)
 
     validate_schema(processed)
     write_output(processed, args.output_path)
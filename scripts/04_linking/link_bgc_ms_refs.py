@@ -32,8 +32,9 @@ import argparse
 import logging
 import math
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -44,6 +45,8 @@ except ModuleNotFoundError as exc:  # pragma: no cover
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "config" / "pipeline_defaults.yaml"
+# Left-hand rows per dense pair-mask block, bounding peak memory on large tables
+PAIR_BLOCK_ROWS = 1024
 OUTPUT_COLUMNS = ["BGCUID", "FeatureID", "CompoundID", "EvidenceType", "EvidenceScore", "Notes"]
 
 TYPE_MAPPING = {
@@ -64,7 +67,9 @@ def load_config(config_path: Path | None) -> Dict[str, Any]:
     return config
 
 
-def read_table(path: Path) -> pd.DataFrame:
+def read_table(path: Path | pd.DataFrame) -> pd.DataFrame:
+    if isinstance(path, pd.DataFrame):
+        return path
     if not path.exists():
         raise FileNotFoundError(f"Table not found: {path}")
     if path.suffix == ".parquet":
@@ -76,7 +81,8 @@ def read_table(path: Path) -> pd.DataFrame:
 
 
 def ensure_list(value: Any) -> List[str]:
-    if isinstance(value, list):
+    # Parquet/Arrow list cells arrive as NumPy arrays rather than lists
+    if isinstance(value, (list, tuple, np.ndarray)):
         return [str(v) for v in value]
     if value is None or (isinstance(value, float) and math.isnan(value)):
         return []
@@ -144,7 +150,9 @@ def score_bgc_feature(
     feature_row: pd.Series,
     delta: float,
 ) -> float:
-    if str(bgc_row.get("SampleID")) != str(feature_row.get("SampleID")):
+    bgc_sample, feature_sample = bgc_row.get("SampleID"), feature_row.get("SampleID")
+    # A missing SampleID never co-occurs, whatever its null representation
+    if pd.isna(bgc_sample) or pd.isna(feature_sample) or str(bgc_sample) != str(feature_sample):
         return 0.0
     intensity = feature_row.get("intensity_normalized")
     if pd.isna(intensity):
@@ -159,10 +167,162 @@ def score_bgc_feature(
     return 0.0
 
 
+def _column_values(df: pd.DataFrame, column: str, default: Any = None) -> np.ndarray:
+    """Column values as an object array, or ``default`` per row when the column is absent."""
+    if column in df.columns:
+        return df[column].to_numpy(dtype=object)
+    return np.full(len(df), default, dtype=object)
+
+
+def _bgc_uids(bgc: pd.DataFrame) -> np.ndarray:
+    return _column_values(bgc, "BGCUID" if "BGCUID" in bgc.columns else "BGCID")
+
+
+def _pair_indices(n_left: int, block_mask: Callable[[slice], np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Row-major ``(left, right)`` indices of a pair mask evaluated in row blocks."""
+    lefts: List[np.ndarray] = [np.empty(0, dtype=np.intp)]
+    rights: List[np.ndarray] = [np.empty(0, dtype=np.intp)]
+    for start in range(0, n_left, PAIR_BLOCK_ROWS):
+        left, right = np.nonzero(block_mask(slice(start, start + PAIR_BLOCK_ROWS)))
+        lefts.append(left + start)
+        rights.append(right)
+    return np.concatenate(lefts), np.concatenate(rights)
+
+
+def _evidence_block(
+    bgc_uids: np.ndarray | None,
+    feature_ids: np.ndarray | None,
+    compound_ids: np.ndarray | None,
+    scores: np.ndarray,
+    evidence_type: str,
+    note: str,
+) -> Dict[str, np.ndarray]:
+    n = len(scores)
+
+    def _ids(values: np.ndarray | None) -> np.ndarray:
+        if values is None:
+            return np.full(n, pd.NA, dtype=object)
+        # Strip padding here so every evidence type carries the IDs rank_candidates keys on
+        return np.array([v.strip() if isinstance(v, str) else v for v in values], dtype=object)
+
+    return {
+        "BGCUID": _ids(bgc_uids),
+        "FeatureID": _ids(feature_ids),
+        "CompoundID": _ids(compound_ids),
+        "EvidenceType": np.full(n, evidence_type, dtype=object),
+        "EvidenceScore": scores,
+        "Notes": np.full(n, note, dtype=object),
+    }
+
+
+def _bgc_compound_evidence(bgc: pd.DataFrame, compounds: pd.DataFrame, alpha: float, beta: float) -> Dict[str, np.ndarray]:
+    """Vectorized ``score_bgc_compound`` over all BGC x compound pairs."""
+    sources = np.array([str(v).strip() for v in _column_values(compounds, "Source", "")], dtype=object)
+    source_codes, vocab = pd.factorize(sources)
+    allowed = np.zeros((len(bgc), len(vocab)), dtype=bool)
+    bgc_scores = np.zeros(len(bgc))
+    for i, (cluster_type, mibig) in enumerate(
+        zip(_column_values(bgc, "ClusterType", ""), _column_values(bgc, "MIBiGHits"))
+    ):
+        matched = set().union(*(TYPE_MAPPING.get(ct, set()) for ct in expand_cluster_types(cluster_type)))
+        allowed[i] = [source in matched for source in vocab]
+        score = alpha
+        if ensure_list(mibig) and score > 0:
+            score += beta
+        bgc_scores[i] = round(min(score, 1.0), 4)
+
+    bgc_idx, compound_idx = _pair_indices(
+        len(bgc),
+        lambda rows: allowed[rows][:, source_codes] & (bgc_scores[rows] > 0)[:, np.newaxis],
+    )
+    return _evidence_block(
+        _bgc_uids(bgc)[bgc_idx],
+        None,
+        _column_values(compounds, "CompoundID")[compound_idx],
+        bgc_scores[bgc_idx],
+        "bgc_compound",
+        "Cluster type vs compound source match",
+    )
+
+
+def _feature_compound_evidence(
+    features: pd.DataFrame,
+    compounds: pd.DataFrame,
+    ppm_tolerance: float,
+    gamma: float,
+) -> Dict[str, np.ndarray]:
+    """Vectorized ``score_feature_compound`` over all feature x compound pairs."""
+    score = min(gamma, 1.0)
+    mz = pd.to_numeric(pd.Series(_column_values(features, "mz")), errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    masses = np.array([estimate_mass(s) for s in _column_values(compounds, "SMILES", "")], dtype=np.float64)
+    valid_mass = ~np.isnan(masses) & (masses != 0)
+
+    def _block(rows: slice) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ppm = np.abs(mz[rows, np.newaxis] - masses) / masses * 1e6
+        return (ppm <= ppm_tolerance) & valid_mass
+
+    if score > 0:
+        feature_idx, compound_idx = _pair_indices(len(features), _block)
+    else:
+        feature_idx = compound_idx = np.empty(0, dtype=np.intp)
+    return _evidence_block(
+        None,
+        _column_values(features, "FeatureID")[feature_idx],
+        _column_values(compounds, "CompoundID")[compound_idx],
+        np.full(len(feature_idx), round(score, 4)),
+        "feature_compound",
+        "m/z within ppm window",
+    )
+
+
+def _bgc_feature_evidence(bgc: pd.DataFrame, features: pd.DataFrame, delta: float) -> Dict[str, np.ndarray]:
+    """Vectorized ``score_bgc_feature`` over all BGC x feature pairs."""
+    normalized = pd.to_numeric(features["intensity_normalized"], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    # Normalized-only tables have no raw intensity; the fallback then scores 0 as before
+    raw = pd.to_numeric(pd.Series(_column_values(features, "intensity", np.nan)), errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    totals = features["_sample_total"].to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fallback = np.where(totals != 0, raw / totals, 0.0)
+    intensity = np.where(np.isnan(normalized), fallback, normalized)
+    feature_scores = np.zeros(len(features))
+    strong = np.flatnonzero(intensity >= 0.01)
+    feature_scores[strong] = [round(min(delta * float(v), 1.0), 4) for v in intensity[strong]]
+
+    # Missing SampleIDs (None/NaN/NA alike) get the -1 sentinel and are masked out
+    # below, so they never pair; everything else compares by its string form
+    samples = np.concatenate([_column_values(bgc, "SampleID"), _column_values(features, "SampleID")])
+    missing = pd.isna(samples)
+    samples[~missing] = [str(v) for v in samples[~missing]]
+    samples[missing] = None
+    sample_codes, _ = pd.factorize(samples)
+    bgc_samples, feature_samples = sample_codes[: len(bgc)], sample_codes[len(bgc):]
+    linked = (feature_scores > 0) & (feature_samples >= 0)
+
+    bgc_idx, feature_idx = _pair_indices(
+        len(bgc),
+        lambda rows: (bgc_samples[rows, np.newaxis] == feature_samples) & linked,
+    )
+    return _evidence_block(
+        _bgc_uids(bgc)[bgc_idx],
+        _column_values(features, "FeatureID")[feature_idx],
+        None,
+        feature_scores[feature_idx],
+        "bgc_feature",
+        "Co-occurrence in sample with high intensity",
+    )
+
+
 def build_mapping(
-    bgc_path: Path,
-    feature_path: Path,
-    chem_path: Path,
+    bgc_path: Path | pd.DataFrame,
+    feature_path: Path | pd.DataFrame,
+    chem_path: Path | pd.DataFrame,
     output_path: Path,
     config: Dict[str, Any],
 ) -> pd.DataFrame:
@@ -181,61 +341,24 @@ def build_mapping(
     if "intensity_normalized" not in features.columns:
         totals = features.groupby("SampleID")["intensity"].transform("sum")
         features["_sample_total"] = totals
-        features["intensity_normalized"] = features.apply(
-            lambda row: row["intensity"] / row["_sample_total"] if row["_sample_total"] else 0,
-            axis=1,
-        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            features["intensity_normalized"] = np.where(totals != 0, features["intensity"] / totals, 0)
     else:
         features["_sample_total"] = 0
 
-    evidence_rows: List[Dict[str, Any]] = []
-
-    for _, bgc_row in bgc.iterrows():
-        for _, compound_row in compounds.iterrows():
-            score = score_bgc_compound(bgc_row, compound_row, alpha, beta)
-            if score > 0:
-                evidence_rows.append(
-                    {
-                        "BGCUID": bgc_row.get("BGCUID", bgc_row.get("BGCID")),
-                        "FeatureID": pd.NA,
-                        "CompoundID": compound_row.get("CompoundID"),
-                        "EvidenceType": "bgc_compound",
-                        "EvidenceScore": round(min(score, 1.0), 4),
-                        "Notes": "Cluster type vs compound source match",
-                    }
-                )
-
-    for _, feature_row in features.iterrows():
-        for _, compound_row in compounds.iterrows():
-            score = score_feature_compound(feature_row, compound_row, ppm_tolerance, gamma)
-            if score > 0:
-                evidence_rows.append(
-                    {
-                        "BGCUID": pd.NA,
-                        "FeatureID": feature_row.get("FeatureID"),
-                        "CompoundID": compound_row.get("CompoundID"),
-                        "EvidenceType": "feature_compound",
-                        "EvidenceScore": round(min(score, 1.0), 4),
-                        "Notes": "m/z within ppm window",
-                    }
-                )
-
-    for _, bgc_row in bgc.iterrows():
-        for _, feature_row in features.iterrows():
-            score = score_bgc_feature(bgc_row, feature_row, delta)
-            if score > 0:
-                evidence_rows.append(
-                    {
-                        "BGCUID": bgc_row.get("BGCUID", bgc_row.get("BGCID")),
-                        "FeatureID": feature_row.get("FeatureID"),
-                        "CompoundID": pd.NA,
-                        "EvidenceType": "bgc_feature",
-                        "EvidenceScore": round(min(score, 1.0), 4),
-                        "Notes": "Co-occurrence in sample with high intensity",
-                    }
-                )
-
-    evidence = pd.DataFrame(evidence_rows, columns=OUTPUT_COLUMNS)
+    # Each evidence type is scored over all pairs at once, in the same
+    # BGC/feature-major order the scalar score_* helpers would visit them
+    blocks = [
+        _bgc_compound_evidence(bgc, compounds, alpha, beta),
+        _feature_compound_evidence(features, compounds, ppm_tolerance, gamma),
+        _bgc_feature_evidence(bgc, features, delta),
+    ]
+    if sum(len(block["EvidenceScore"]) for block in blocks):
+        evidence = pd.DataFrame(
+            {column: np.concatenate([block[column] for block in blocks]) for column in OUTPUT_COLUMNS}
+        )
+    else:
+        evidence = pd.DataFrame([], columns=OUTPUT_COLUMNS)
     evidence = evidence.fillna({"BGCUID": "", "FeatureID": "", "CompoundID": ""})
     output_path.parent.mkdir(parents=True, exist_ok=True)
     if output_path.suffix == ".parquet":
@@ -62,7 +62,9 @@ def load_config(config_path: Path | None) -> Dict[str, Any]:
     return config
 
 
-def load_compounds(path: Path) -> pd.DataFrame:
+def load_compounds(path: Path | pd.DataFrame) -> pd.DataFrame:
+    if isinstance(path, pd.DataFrame):
+        return path
     if not path.exists():
         raise FileNotFoundError(f"Chemical reference table not found: {path}")
     if path.suffix == ".parquet":
@@ -217,7 +219,7 @@ def load_external(path: Path | None) -> pd.DataFrame:
 
 
 def build_admet_table(
-    chem_path: Path,
+    chem_path: Path | pd.DataFrame,
     output_path: Path,
     external_csv: Path | None = None,
     config_path: Path | None = None,
@@ -226,7 +228,8 @@ def build_admet_table(
     Build comprehensive ADMET table with RDKit-calculated properties.
     
     Args:
-        chem_path: Path to chemical reference table (must contain SMILES)
+        chem_path: Path to chemical reference table (must contain SMILES), or the
+            already loaded table
         output_path: Path to save ADMET results
         external_csv: Optional external ADMET data to merge
         config_path: Optional custom configuration file
@@ -241,7 +244,8 @@ def build_admet_table(
         format=logging_config.get("format", "%(levelname)s - %(message)s"),
     )
 
-    logger.info(f"Loading compounds from {chem_path}")
+    if not isinstance(chem_path, pd.DataFrame):
+        logger.info(f"Loading compounds from {chem_path}")
     compounds = load_compounds(chem_path)
     
     if "SMILES" not in compounds.columns:
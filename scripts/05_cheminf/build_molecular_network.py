@@ -49,6 +49,11 @@ try:
 except ImportError as exc:
     raise RuntimeError("NetworkX is required. Install with: conda install -c conda-forge networkx") from exc
 
+try:
+    from scipy.sparse.csgraph import shortest_path
+except ImportError:
+    shortest_path = None
+
 try:
     import community as community_louvain
 except ImportError:
@@ -57,6 +62,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+TANIMOTO_TILE_ROWS = 64
+
 
 def load_fingerprints(path: Path) -> pd.DataFrame:
     """Load fingerprint data from parquet file."""
@@ -73,6 +80,69 @@ def load_admet(path: Path) -> Optional[pd.DataFrame]:
     return pd.read_parquet(path)
 
 
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Count set bits per element of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    # NumPy < 2.0: count on the byte view via a lookup table
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (8,))
+    return table[as_bytes].sum(axis=-1, dtype=np.uint64)
+
+
+def _pack_fingerprints(fps: List[Any], n_bits: int) -> np.ndarray:
+    """Pack RDKit bit vectors into an (n, n_bits / 64) uint64 matrix."""
+    n_words = (n_bits + 63) // 64
+    bits = np.zeros((len(fps), n_words * 64), dtype=np.uint8)
+    row = np.zeros(n_bits, dtype=np.uint8)
+    for i, fp in enumerate(fps):
+        DataStructs.ConvertToNumpyArray(fp, row)
+        bits[i, :n_bits] = row
+    return np.packbits(bits, axis=1).view(np.uint64)
+
+
+def tanimoto_matrix_tiled(
+    fp_matrix: np.ndarray,
+    block_size: int = TANIMOTO_TILE_ROWS,
+) -> np.ndarray:
+    """
+    Compute the full pairwise Tanimoto matrix from packed uint64 fingerprints.
+    
+    Rows are processed in blocks of ``block_size`` so both operand tiles stay
+    cache-resident during each tile product; only the upper triangle of tiles
+    is computed and mirrored.
+    
+    Args:
+        fp_matrix: (n, n_words) uint64 array of packed fingerprints
+        block_size: Number of rows per tile
+        
+    Returns:
+        (n, n) float64 similarity matrix
+    """
+    n = fp_matrix.shape[0]
+    counts = _popcount(fp_matrix).sum(axis=1, dtype=np.int64)
+    similarity = np.zeros((n, n), dtype=np.float64)
+    
+    for i0 in range(0, n, block_size):
+        a_tile = fp_matrix[i0:i0 + block_size]
+        a_counts = counts[i0:i0 + block_size]
+        for j0 in range(i0, n, block_size):
+            b_tile = fp_matrix[j0:j0 + block_size]
+            b_counts = counts[j0:j0 + block_size]
+            inter = _popcount(a_tile[:, None, :] & b_tile[None, :, :]).sum(axis=-1, dtype=np.int64)
+            union = a_counts[:, None] + b_counts[None, :] - inter
+            tile = np.divide(
+                inter,
+                union,
+                out=np.zeros(inter.shape, dtype=np.float64),
+                where=union > 0,
+            )
+            similarity[i0:i0 + block_size, j0:j0 + block_size] = tile
+            similarity[j0:j0 + block_size, i0:i0 + block_size] = tile.T
+    
+    return similarity
+
+
 def calculate_similarity_matrix(
     fingerprints_df: pd.DataFrame,
     similarity_threshold: float = 0.0
@@ -112,14 +182,9 @@ def calculate_similarity_matrix(
         
         fps.append(fp)
     
-    # Calculate similarity matrix
-    similarity_matrix = np.zeros((n_compounds, n_compounds))
-    
-    for i in range(n_compounds):
-        for j in range(i, n_compounds):
-            sim = DataStructs.TanimotoSimilarity(fps[i], fps[j])
-            similarity_matrix[i, j] = sim
-            similarity_matrix[j, i] = sim
+    # Calculate similarity matrix on packed fingerprints, tile by tile
+    fp_matrix = _pack_fingerprints(fps, n_bits=2048)
+    similarity_matrix = tanimoto_matrix_tiled(fp_matrix)
     
     logger.info(f"Similarity matrix calculated. Mean similarity: {similarity_matrix.mean():.3f}")
     
@@ -187,6 +252,45 @@ def build_network(
     return G
 
 
+def _giant_component_eigenvector(G: nx.Graph) -> Dict[str, float]:
+    """
+    Compute eigenvector centrality on the largest connected component.
+    
+    Power iteration on a disconnected graph tends to run to ``max_iter``
+    without a meaningful result, so only the giant component is solved
+    (via the sparse eigensolver when SciPy is available).
+    
+    Args:
+        G: NetworkX graph
+        
+    Returns:
+        Dictionary mapping node to eigenvector centrality (giant component only)
+    """
+    if G.number_of_edges() == 0:
+        return {}
+    
+    components = list(nx.connected_components(G))
+    giant = G.subgraph(max(components, key=len))
+    if len(components) > 1:
+        logger.info(
+            f"Graph has {len(components)} components; "
+            f"eigenvector centrality computed on giant component ({giant.number_of_nodes()} nodes)"
+        )
+    
+    # ARPACK needs at least 3 nodes; tiny components use power iteration
+    if giant.number_of_nodes() > 2:
+        try:
+            return nx.eigenvector_centrality_numpy(giant)
+        except ImportError:
+            logger.debug("SciPy not available; falling back to power iteration")
+    
+    try:
+        return nx.eigenvector_centrality(giant, max_iter=1000)
+    except nx.PowerIterationFailedConvergence:
+        logger.warning("Eigenvector centrality calculation failed to converge.")
+        return {}
+
+
 def calculate_centrality_metrics(G: nx.Graph) -> pd.DataFrame:
     """
     Calculate various centrality metrics for all nodes.
@@ -199,29 +303,33 @@ def calculate_centrality_metrics(G: nx.Graph) -> pd.DataFrame:
     """
     logger.info("Calculating centrality metrics...")
     
+    # Align every metric on one canonical node order
+    nodes = list(G.nodes())
+    n_nodes = len(nodes)
+    
     metrics = {
-        'CompoundID': list(G.nodes()),
-        'Degree': [G.degree(node) for node in G.nodes()],
+        'CompoundID': nodes,
+        'Degree': [degree for _, degree in G.degree(nodes)],
     }
     
     # Only calculate for connected graphs
     if nx.is_connected(G):
-        metrics['Betweenness'] = list(nx.betweenness_centrality(G).values())
-        metrics['Closeness'] = list(nx.closeness_centrality(G).values())
+        betweenness = nx.betweenness_centrality(G)
+        closeness = nx.closeness_centrality(G)
+        metrics['Betweenness'] = [betweenness[node] for node in nodes]
+        metrics['Closeness'] = [closeness[node] for node in nodes]
     else:
         logger.warning("Graph is not connected. Some metrics will be limited.")
-        metrics['Betweenness'] = [0.0] * G.number_of_nodes()
-        metrics['Closeness'] = [0.0] * G.number_of_nodes()
+        metrics['Betweenness'] = [0.0] * n_nodes
+        metrics['Closeness'] = [0.0] * n_nodes
     
-    # Eigenvector centrality (may fail for disconnected graphs)
-    try:
-        metrics['Eigenvector'] = list(nx.eigenvector_centrality(G, max_iter=1000).values())
-    except:
-        logger.warning("Eigenvector centrality calculation failed.")
-        metrics['Eigenvector'] = [0.0] * G.number_of_nodes()
+    # Eigenvector centrality on the giant component only; other nodes get 0
+    eigenvector = _giant_component_eigenvector(G)
+    metrics['Eigenvector'] = [eigenvector.get(node, 0.0) for node in nodes]
     
     # Clustering coefficient
-    metrics['Clustering'] = list(nx.clustering(G).values())
+    clustering = nx.clustering(G)
+    metrics['Clustering'] = [clustering[node] for node in nodes]
     
     return pd.DataFrame(metrics)
 
@@ -263,8 +371,17 @@ def calculate_network_stats(G: nx.Graph) -> Dict[str, Any]:
         stats['transitivity'] = nx.transitivity(G)
     
     if nx.is_connected(G):
-        stats['diameter'] = nx.diameter(G)
-        stats['average_shortest_path_length'] = nx.average_shortest_path_length(G)
+        if shortest_path is not None:
+            # All-pairs BFS on the CSR adjacency runs in C
+            distances = shortest_path(nx.to_scipy_sparse_array(G), method='auto', unweighted=True)
+            n_nodes = G.number_of_nodes()
+            stats['diameter'] = int(distances.max())
+            stats['average_shortest_path_length'] = (
+                float(distances.sum() / (n_nodes * (n_nodes - 1))) if n_nodes > 1 else 0.0
+            )
+        else:
+            stats['diameter'] = nx.diameter(G)
+            stats['average_shortest_path_length'] = nx.average_shortest_path_length(G)
     
     return stats
 
@@ -11,7 +11,7 @@
   - config: 可选 YAML，控制指纹半径、位数等。
 
 输出 / Outputs:
-  - 含 CompoundID、SMILES、Fingerprint 字符串的表；附加 .meta.json 记录统计。
+  - 含 CompoundID、SMILES、Fingerprint 的表（Parquet 中为 packbits 压缩字节，CSV/TSV 中为 0/1 字符串）；附加 .meta.json 记录统计。
 
 主要功能 / Key Functions:
   - load_config(...): 读取全局配置。
@@ -29,20 +29,34 @@ import argparse
 import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 
 try:  # pragma: no cover - RDKit 可能缺失
-    from rdkit import Chem
+    from rdkit import Chem, DataStructs
     from rdkit.Chem import AllChem
     _HAS_RDKIT = True
 except ImportError:  # pragma: no cover
     Chem = None  # type: ignore
+    DataStructs = None  # type: ignore
     AllChem = None  # type: ignore
     _HAS_RDKIT = False
 
+try:  # pragma: no cover - 旧版 RDKit 无 fingerprint generator
+    from rdkit.Chem import rdFingerprintGenerator
+    _HAS_FP_GENERATOR = True
+except ImportError:  # pragma: no cover
+    rdFingerprintGenerator = None  # type: ignore
+    _HAS_FP_GENERATOR = False
+
 try:
     import yaml
 except ModuleNotFoundError as exc:  # pragma: no cover
@@ -52,6 +66,9 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "config" / "pipeline_defaults.yaml"
 
+# Hash fallback fans out to worker processes only above this size; below it, process start-up dominates
+HASH_POOL_MIN_ROWS = 200_000
+
 
 def load_config(config_path: Path | None) -> Dict[str, Any]:
     target = config_path or DEFAULT_CONFIG
@@ -84,62 +101,141 @@ def _smiles_to_mol(smiles: str):  # pragma: no cover - 只有 RDKit 时使用
     return mol
 
 
-def _hash_fingerprint(smiles: str, n_bits: int) -> str:
-    smiles = smiles or ""
-    bit_chars = []
-    needed_hex_chars = (n_bits + 3) // 4
-    chunk_count = (needed_hex_chars + 63) // 64
-    for chunk_idx in range(chunk_count):
-        digest = hashlib.sha256(f"{smiles}-{chunk_idx}".encode("utf-8")).hexdigest()
-        bit_chars.append(digest)
-    hex_string = "".join(bit_chars)[:needed_hex_chars]
-    bit_string = bin(int(hex_string, 16))[2:].zfill(needed_hex_chars * 4)
-    return bit_string[:n_bits]
+def _hash_digest(smiles: str, n_bytes: int) -> bytes:
+    # Always SHAKE-128 (stdlib XOF) so fallback bits never depend on optional packages
+    return hashlib.shake_128((smiles or "").encode("utf-8")).digest(n_bytes)
+
+
+def _hash_chunk(smiles: List[str], n_bytes: int) -> bytes:
+    return b"".join(_hash_digest(s, n_bytes) for s in smiles)
+
+
+def _hash_fingerprint_matrix(smiles: List[str], n_bits: int) -> np.ndarray:
+    """Hash every SMILES and unpack all digests into one ``(N, n_bits)`` uint8 bit matrix."""
+    n_bytes = (n_bits + 7) // 8
+    workers = os.cpu_count() or 1
+    # Only fork: spawn/forkserver children re-import this script by module name,
+    # which fails when it was loaded by file path. Workers still receive
+    # _hash_chunk by reference, so the module must be registered under its name.
+    can_fork = "fork" in multiprocessing.get_all_start_methods() and __name__ in sys.modules
+    if can_fork and workers > 1 and len(smiles) >= HASH_POOL_MIN_ROWS:
+        # One contiguous chunk per core; map() keeps the digests in input order
+        size = -(-len(smiles) // workers)
+        chunks = [smiles[start:start + size] for start in range(0, len(smiles), size)]
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            digests = b"".join(executor.map(_hash_chunk, chunks, repeat(n_bytes)))
+    else:
+        digests = _hash_chunk(smiles, n_bytes)
+    raw = np.frombuffer(digests, dtype=np.uint8).reshape(len(smiles), n_bytes)
+    return np.unpackbits(raw, axis=1)[:, :n_bits]
+
+
+def _morgan_bit_matrix(mols: List[Any], radius: int, n_bits: int) -> np.ndarray:  # pragma: no cover - 只有 RDKit 时使用
+    """Morgan bits for ``mols`` as an ``(N, n_bits)`` uint8 matrix, batched in C++ where RDKit allows."""
+    if _HAS_FP_GENERATOR:
+        generator = rdFingerprintGenerator.GetMorganGenerator(radius=radius, fpSize=n_bits)
+        if hasattr(generator, "GetFingerprints"):
+            # numThreads=-1: one native thread per core
+            bitvects = generator.GetFingerprints(mols, numThreads=-1)
+        else:
+            bitvects = [generator.GetFingerprint(mol) for mol in mols]
+    else:
+        bitvects = [AllChem.GetMorganFingerprintAsBitVect(mol, radius, nBits=n_bits) for mol in mols]
+
+    bits = np.zeros((len(mols), n_bits), dtype=np.uint8)
+    bit_row = np.zeros(n_bits, dtype=np.uint8)
+    for i, bitvect in enumerate(bitvects):
+        DataStructs.ConvertToNumpyArray(bitvect, bit_row)
+        bits[i] = bit_row
+    return bits
+
+
+def _bit_matrix_to_strings(bits: np.ndarray) -> List[str]:
+    """Render each row of a 0/1 matrix as a bitstring, decoding the whole buffer once."""
+    n_bits = bits.shape[1]
+    text = (bits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+    return [text[start:start + n_bits] for start in range(0, len(text), n_bits)]
+
+
+def _unpack_fingerprints(packed: List[bytes], n_bits: int) -> np.ndarray:
+    """Inverse of the packed ``Fingerprint`` column: an ``(N, n_bits)`` uint8 bit matrix."""
+    raw = np.frombuffer(b"".join(packed), dtype=np.uint8).reshape(len(packed), -1)
+    return np.unpackbits(raw, axis=1)[:, :n_bits]
 
 
 def compute_fingerprints(df: pd.DataFrame, radius: int, n_bits: int) -> pd.DataFrame:
-    fingerprints: List[Dict[str, str]] = []
+    """
+    Fingerprint every valid SMILES.
+
+    ``Fingerprint`` holds ``np.packbits`` bytes (``ceil(n_bits / 8)`` per row, MSB
+    first); the bit width is recorded in ``attrs["fingerprint_bits"]``.
+    """
+    compound_ids = [str(v) for v in df["CompoundID"]] if "CompoundID" in df.columns else ["None"] * len(df)
+    all_smiles = [str(v) for v in df["SMILES"]] if "SMILES" in df.columns else [""] * len(df)
+
+    ids: List[str] = []
+    smiles_kept: List[str] = []
     invalid: List[str] = []
-    for _, row in df.iterrows():
-        compound_id = str(row.get("CompoundID"))
-        smiles = str(row.get("SMILES", ""))
-        if _HAS_RDKIT:
+    if _HAS_RDKIT:
+        mols: List[Any] = []
+        for compound_id, smiles in zip(compound_ids, all_smiles):
             mol = _smiles_to_mol(smiles)
             if mol is None:
                 invalid.append(compound_id)
                 continue
-            bitvect = AllChem.GetMorganFingerprintAsBitVect(mol, radius, nBits=n_bits)
-            fingerprint = bitvect.ToBitString()
-        else:
+            mols.append(mol)
+            ids.append(compound_id)
+            smiles_kept.append(smiles)
+        # Parse serially, fingerprint the whole batch at once
+        bits = _morgan_bit_matrix(mols, radius, n_bits)
+    else:
+        for compound_id, smiles in zip(compound_ids, all_smiles):
             if not smiles:
                 invalid.append(compound_id)
                 continue
-            fingerprint = _hash_fingerprint(smiles, n_bits)
-        fingerprints.append(
-            {
-                "CompoundID": compound_id,
-                "SMILES": smiles,
-                "Fingerprint": fingerprint,
-            }
-        )
+            ids.append(compound_id)
+            smiles_kept.append(smiles)
+        # Hash per row, but unpack the bits for all rows at once
+        bits = _hash_fingerprint_matrix(smiles_kept, n_bits)
     if invalid:
         logger.warning("Skipped %d compounds due to invalid SMILES", len(invalid))
-    return pd.DataFrame(fingerprints)
+    if not ids:
+        return pd.DataFrame()
+
+    # One contiguous packed buffer, sliced into a bytes object per compound
+    packed = np.packbits(bits, axis=1)
+    buffer, width = packed.tobytes(), packed.shape[1]
+    fp_df = pd.DataFrame(
+        {
+            "CompoundID": ids,
+            "SMILES": smiles_kept,
+            "Fingerprint": [buffer[start:start + width] for start in range(0, len(buffer), width)],
+        }
+    )
+    fp_df.attrs["fingerprint_bits"] = n_bits
+    return fp_df
 
 
 def write_output(df: pd.DataFrame, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    n_bits = df.attrs.get("fingerprint_bits", len(df["Fingerprint"].iloc[0]) * 8 if not df.empty else 0)
     if output_path.suffix == ".parquet":
         df.to_parquet(output_path, index=False)
     elif output_path.suffix in {".csv", ".tsv"}:
         sep = "," if output_path.suffix == ".csv" else "	"
-        df.to_csv(output_path, index=False, sep=sep)
+        text_df = df
+        if not df.empty:
+            # Text formats keep the readable '0'/'1' bitstrings
+            bits = _unpack_fingerprints(df["Fingerprint"].tolist(), n_bits)
+            text_df = df.assign(Fingerprint=_bit_matrix_to_strings(bits))
+        text_df.to_csv(output_path, index=False, sep=sep)
     else:
         raise NotImplementedError(f"Unsupported output format: {output_path.suffix}")
     metadata = {
         "count": int(df.shape[0]),
         "columns": df.columns.tolist(),
-        "fingerprint_bits": len(df["Fingerprint"].iloc[0]) if not df.empty else 0,
+        "fingerprint_bits": n_bits,
         "tool": "rdkit" if _HAS_RDKIT else "hash_fallback",
     }
     output_path.with_suffix(output_path.suffix + ".meta.json").write_text(
@@ -29,10 +29,18 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
+try:  # pragma: no cover - Numba optional, NumPy fallback
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore
+    _HAS_NUMBA = False
+
 try:
     import yaml
 except ModuleNotFoundError as exc:  # pragma: no cover
@@ -61,7 +69,8 @@ def load_fingerprints(path: Path) -> pd.DataFrame:
         df = pd.read_parquet(path)
     elif path.suffix in {".csv", ".tsv"}:
         sep = "," if path.suffix == ".csv" else "	"
-        df = pd.read_csv(path, sep=sep)
+        # Bitstrings must stay text: numeric inference drops their leading zeros
+        df = pd.read_csv(path, sep=sep, dtype={"Fingerprint": str})
     else:
         raise NotImplementedError(f"Unsupported table format: {path.suffix}")
     required = {"CompoundID", "Fingerprint"}
@@ -71,67 +80,148 @@ def load_fingerprints(path: Path) -> pd.DataFrame:
     return df
 
 
-def fingerprint_to_bits(bitstring: str) -> Set[int]:
-    return {idx for idx, bit in enumerate(bitstring) if bit == "1"}
-
-
-def tanimoto(a: Set[int], b: Set[int]) -> float:
-    if not a and not b:
-        return 1.0
-    intersection = len(a & b)
-    union = len(a | b)
-    if union == 0:
-        return 0.0
-    return intersection / union
+def fingerprint_to_words(bitstring: str) -> np.ndarray:
+    """Pack a '0'/'1' bitstring into uint64 words (zero-padded to 64 bits)."""
+    bits = np.frombuffer(bitstring.encode("ascii"), dtype=np.uint8) == ord("1")
+    padded = np.zeros(((bits.size + 63) // 64) * 64, dtype=np.uint8)
+    padded[: bits.size] = bits
+    return np.packbits(padded).view(np.uint64)
+
+
+def _packed_bytes_to_words(fingerprints: List[bytes]) -> np.ndarray:
+    """Zero-pad ``np.packbits`` fingerprint bytes to whole uint64 words, one row each."""
+    n_bytes = max((len(fp) for fp in fingerprints), default=0)
+    width = ((n_bytes + 7) // 8) * 8
+    raw = b"".join(bytes(fp).ljust(width, b"\0") for fp in fingerprints)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(fingerprints), width).view(np.uint64)
+
+
+def fingerprints_to_words(fingerprints: List[bytes] | List[str]) -> np.ndarray:
+    """
+    Pack a Fingerprint column into one ``(N, words)`` uint64 matrix.
+
+    Accepts the packed bytes written by rdkit_fingerprints.py as well as the
+    '0'/'1' bitstrings found in CSV exports and older Parquet files.
+    """
+    if fingerprints and isinstance(fingerprints[0], (bytes, bytearray, memoryview)):
+        return _packed_bytes_to_words(fingerprints)
+    bitstrings = [str(fp) for fp in fingerprints]
+    lengths = {len(b) for b in bitstrings}
+    if len(lengths) != 1:
+        width = max(lengths, default=0)
+        return np.stack([fingerprint_to_words(b.ljust(width, "0")) for b in bitstrings])
+    n_bits = lengths.pop()
+    raw = np.frombuffer("".join(bitstrings).encode("ascii"), dtype=np.uint8)
+    bits = np.zeros((len(bitstrings), ((n_bits + 63) // 64) * 64), dtype=np.uint8)
+    bits[:, :n_bits] = raw.reshape(len(bitstrings), n_bits) == ord("1")
+    return np.ascontiguousarray(np.packbits(bits, axis=1)).view(np.uint64)
+
+
+def _popcount_rows(words: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(words.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _tanimoto_one_to_many(a: np.ndarray, block: np.ndarray) -> np.ndarray:
+    """Tanimoto of one packed fingerprint against every row of ``block``."""
+    intersection = _popcount_rows(block & a)
+    union = _popcount_rows(block | a)
+    return np.divide(intersection, union, out=np.ones(len(block)), where=union > 0)
+
+
+def _assign_leaders_numpy(words: np.ndarray, threshold: float) -> np.ndarray:
+    """Greedy leader clustering: join the first representative within ``threshold``."""
+    labels = np.empty(len(words), dtype=np.int64)
+    representatives = np.empty_like(words)
+    n_clusters = 0
+    for i in range(len(words)):
+        if n_clusters:
+            hits = np.flatnonzero(_tanimoto_one_to_many(words[i], representatives[:n_clusters]) >= threshold)
+            if hits.size:
+                labels[i] = hits[0]
+                continue
+        representatives[n_clusters] = words[i]
+        labels[i] = n_clusters
+        n_clusters += 1
+    return labels
+
+
+if _HAS_NUMBA:
+    # Numba pickles the defining module name into its on-disk cache, so only
+    # persist it for CLI runs (always "__main__"); file-path imports under
+    # other names compile per process instead of reading a foreign cache.
+    _JIT_CACHE = __name__ == "__main__"
+
+    @njit(cache=_JIT_CACHE)
+    def _popcount64(x):  # pragma: no cover - compiled
+        # SWAR popcount; LLVM lowers this pattern to a POPCNT instruction
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+    @njit(cache=_JIT_CACHE)
+    def _tanimoto_packed_numba(a, b):  # pragma: no cover - compiled
+        intersection = np.uint64(0)
+        union = np.uint64(0)
+        for k in range(a.size):
+            intersection += _popcount64(a[k] & b[k])
+            union += _popcount64(a[k] | b[k])
+        if union == 0:
+            return 1.0
+        return intersection / union
+
+    @njit(cache=_JIT_CACHE)
+    def _assign_leaders_numba(words, threshold):  # pragma: no cover - compiled
+        labels = np.empty(words.shape[0], dtype=np.int64)
+        leaders = np.empty(words.shape[0], dtype=np.int64)
+        n_clusters = 0
+        for i in range(words.shape[0]):
+            labels[i] = -1
+            for c in range(n_clusters):
+                if _tanimoto_packed_numba(words[i], words[leaders[c]]) >= threshold:
+                    labels[i] = c
+                    break
+            if labels[i] < 0:
+                leaders[n_clusters] = i
+                labels[i] = n_clusters
+                n_clusters += 1
+        return labels
+
+    assign_leaders = _assign_leaders_numba
+else:
+    assign_leaders = _assign_leaders_numpy
 
 
 def cluster_fingerprints(
     df: pd.DataFrame,
     threshold: float,
 ) -> pd.DataFrame:
-    entries = []
-    for _, row in df.iterrows():
-        entries.append(
-            {
-                "CompoundID": str(row["CompoundID"]),
-                "bits": fingerprint_to_bits(str(row["Fingerprint"])),
-            }
-        )
-
-    clusters: List[Dict[str, Any]] = []
-    for entry in entries:
-        assigned = False
-        for cluster in clusters:
-            score = tanimoto(entry["bits"], cluster["representative"])
-            if score >= threshold:
-                cluster["members"].append(entry["CompoundID"])
-                cluster["bitsets"].append(entry["bits"])
-                assigned = True
-                break
-        if not assigned:
-            clusters.append(
-                {
-                    "representative": entry["bits"],
-                    "members": [entry["CompoundID"]],
-                    "bitsets": [entry["bits"]],
-                }
-            )
-
-    cluster_rows: List[Dict[str, Any]] = []
-    for idx, cluster in enumerate(clusters, start=1):
-        cluster_id = f"CLUSTER_{idx:03d}"
-        members = sorted(cluster["members"])
-        size = len(members)
-        for member in members:
-            cluster_rows.append(
-                {
-                    "CompoundID": member,
-                    "ClusterID": cluster_id,
-                    "ClusterSize": size,
-                }
-            )
-
-    return pd.DataFrame(cluster_rows)
+    if df.empty:
+        empty = pd.DataFrame()
+        empty.attrs["n_clusters"] = 0
+        return empty
+
+    compound_ids = df["CompoundID"].astype(str).to_numpy()
+    words = fingerprints_to_words(df["Fingerprint"].tolist())
+    labels = assign_leaders(words, float(threshold))
+
+    sizes = np.bincount(labels)
+    clusters = pd.DataFrame({"CompoundID": compound_ids, "_label": labels})
+    # Clusters in order of first appearance, members sorted within each
+    clusters = clusters.sort_values(["_label", "CompoundID"], kind="stable", ignore_index=True)
+    label_order = clusters["_label"].to_numpy()
+    result = pd.DataFrame(
+        {
+            "CompoundID": clusters["CompoundID"].to_numpy(),
+            "ClusterID": [f"CLUSTER_{label + 1:03d}" for label in label_order],
+            "ClusterSize": sizes[label_order],
+        }
+    )
+    # Labels are dense 0..k-1, so the cluster count falls out of the bincount
+    result.attrs["n_clusters"] = len(sizes)
+    return result
 
 
 def write_outputs(df: pd.DataFrame, output_path: Path, figure_path: Path | None) -> None:
@@ -5,19 +5,81 @@ Generate molecular network visualization from GraphML file.
 """
 
 import argparse
+import json
 from pathlib import Path
+from typing import Dict, Tuple
 import matplotlib.pyplot as plt
 import networkx as nx
 import logging
 
+try:
+    import pygraphviz  # noqa: F401 - required by nx.nx_agraph
+    _HAS_GRAPHVIZ = True
+except ImportError:
+    _HAS_GRAPHVIZ = False
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Above this size matplotlib's per-artist drawing becomes the bottleneck
+LARGE_GRAPH_NODES = 1000
+
+
+def compute_layout(
+    G: nx.Graph,
+    layout: str,
+    cache_path: Path | None = None
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Compute node positions, reusing a persisted layout when it is still valid.
+    
+    Args:
+        G: NetworkX graph
+        layout: Layout algorithm ('spring', 'circular', 'kamada_kawai')
+        cache_path: Optional JSON file used to persist positions
+        
+    Returns:
+        Dictionary mapping node to (x, y)
+    """
+    if cache_path is not None and cache_path.exists():
+        cached = json.loads(cache_path.read_text(encoding='utf-8'))
+        if set(cached) == set(G.nodes()):
+            logger.info(f"Reusing cached layout from {cache_path}")
+            return {node: tuple(xy) for node, xy in cached.items()}
+    
+    if layout == 'spring':
+        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    elif layout == 'circular':
+        pos = nx.circular_layout(G)
+    elif layout == 'kamada_kawai':
+        pos = nx.kamada_kawai_layout(G)
+    else:
+        pos = nx.spring_layout(G)
+    
+    if cache_path is not None:
+        cache_path.write_text(
+            json.dumps({node: [float(x), float(y)] for node, (x, y) in pos.items()}),
+            encoding='utf-8'
+        )
+    return pos
+
+
+def _draw_graphviz(G: nx.Graph, output_path: Path) -> None:
+    """Lay out and rasterize the graph with Graphviz sfdp."""
+    A = nx.nx_agraph.to_agraph(G)
+    A.graph_attr.update(overlap='false', outputorder='edgesfirst')
+    A.node_attr.update(shape='point', width='0.05')
+    A.edge_attr.update(color='#80808080')
+    A.layout(prog='sfdp')
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    A.draw(str(output_path), format='png')
+
 
 def visualize_network(
     graphml_path: Path,
     output_path: Path,
-    layout: str = 'spring'
+    layout: str = 'spring',
+    backend: str = 'auto'
 ) -> None:
     """
     Visualize molecular network and save to PNG.
@@ -26,6 +88,7 @@ def visualize_network(
         graphml_path: Path to GraphML file
         output_path: Path to save PNG visualization
         layout: Layout algorithm ('spring', 'circular', 'kamada_kawai')
+        backend: 'matplotlib', 'graphviz', or 'auto' (Graphviz for large graphs)
     """
     if not graphml_path.exists():
         logger.error(f"GraphML file not found: {graphml_path}")
@@ -35,18 +98,24 @@ def visualize_network(
     logger.info(f"Loading network from {graphml_path}")
     G = nx.read_graphml(graphml_path)
     
+    if backend == 'auto':
+        large = G.number_of_nodes() > LARGE_GRAPH_NODES
+        backend = 'graphviz' if large and _HAS_GRAPHVIZ else 'matplotlib'
+    if backend == 'graphviz':
+        if not _HAS_GRAPHVIZ:
+            raise RuntimeError("pygraphviz is required for the graphviz backend")
+        _draw_graphviz(G, output_path)
+        logger.info(f"Network visualization saved to {output_path}")
+        return
+    
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 10))
     
-    # Choose layout
-    if layout == 'spring':
-        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-    elif layout == 'circular':
-        pos = nx.circular_layout(G)
-    elif layout == 'kamada_kawai':
-        pos = nx.kamada_kawai_layout(G)
-    else:
-        pos = nx.spring_layout(G)
+    # Layout is persisted next to the GraphML and reused while it is current
+    cache_path = graphml_path.with_suffix(f'.{layout}.layout.json')
+    if cache_path.exists() and cache_path.stat().st_mtime < graphml_path.stat().st_mtime:
+        cache_path.unlink()
+    pos = compute_layout(G, layout, cache_path)
     
     # Draw nodes
     node_colors = []
@@ -122,9 +191,16 @@ def main():
         choices=['spring', 'circular', 'kamada_kawai'],
         help='Layout algorithm'
     )
+    parser.add_argument(
+        '--backend',
+        type=str,
+        default='auto',
+        choices=['auto', 'matplotlib', 'graphviz'],
+        help='Rendering backend (auto uses Graphviz for large graphs when available)'
+    )
     
     args = parser.parse_args()
-    visualize_network(args.graphml_path, args.output_path, args.layout)
+    visualize_network(args.graphml_path, args.output_path, args.layout, args.backend)
 
 
 if __name__ == '__main__':
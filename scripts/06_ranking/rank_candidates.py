@@ -29,20 +29,46 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
+import numpy as np
 import pandas as pd
 
+try:  # pragma: no cover - pyarrow optional, pandas writer fallback
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover
+    pa = pacsv = pq = None  # type: ignore
+    _HAS_PYARROW = False
+
 try:
     import yaml
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise RuntimeError("PyYAML is required to run rank_candidates.py") from exc
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "config" / "pipeline_defaults.yaml"
+# Below this many candidates the NumPy kernel is faster than importing and
+# compiling the Numba one
+NUMBA_MIN_ROWS = 1_000_000
+
+EVIDENCE_COLUMNS = ["BGCUID", "FeatureID", "CompoundID", "EvidenceType", "EvidenceScore"]
+EVIDENCE_DTYPES = {
+    "BGCUID": "string",
+    "FeatureID": "string",
+    "CompoundID": "string",
+    "EvidenceType": "category",
+    "EvidenceScore": "float64",
+}
 
 
 def load_config(config_path: Path | None) -> Dict[str, Any]:
@@ -50,28 +76,45 @@ def load_config(config_path: Path | None) -> Dict[str, Any]:
     if not target.exists():
         raise FileNotFoundError(f"Configuration file not found: {target}")
     with target.open("r", encoding="utf-8") as fh:
-        config = yaml.safe_load(fh)
+        config = yaml.load(fh, Loader=_YAML_LOADER)
     if not isinstance(config, dict):
         raise ValueError(f"Configuration malformed (expected dict): {target}")
     return config
 
 
-def read_table(path: Path) -> pd.DataFrame:
+def _prefer_parquet(path: Path) -> Path:
+    """Return an up-to-date sibling ``.parquet`` for a CSV/TSV path, if one exists."""
+    if path.suffix not in {".csv", ".tsv"}:
+        return path
+    sibling = path.with_suffix(".parquet")
+    if sibling.exists() and (not path.exists() or sibling.stat().st_mtime >= path.stat().st_mtime):
+        logger.debug("Using Parquet sibling %s instead of %s", sibling, path)
+        return sibling
+    return path
+
+
+def read_table(
+    path: Path,
+    columns: List[str] | None = None,
+    dtype: Dict[str, str] | None = None,
+) -> pd.DataFrame:
+    path = _prefer_parquet(path)
     if not path.exists():
         raise FileNotFoundError(f"Required table not found: {path}")
     if path.suffix == ".parquet":
-        return pd.read_parquet(path)
+        return pd.read_parquet(path, columns=columns, engine="pyarrow", pre_buffer=True)
     if path.suffix in {".csv", ".tsv"}:
         sep = "," if path.suffix == ".csv" else "	"
-        return pd.read_csv(path, sep=sep)
+        return pd.read_csv(path, sep=sep, usecols=columns, dtype=dtype)
     raise NotImplementedError(f"Unsupported table format: {path.suffix}")
 
 
-def _sanitize_compound_id(value: Any) -> str:
-    if value is None:
-        return ""
-    value = str(value).strip()
-    return value
+def _collect_unique_ids(df: pd.DataFrame, column: str) -> pd.Series:
+    """Sorted, de-duplicated non-blank ``column`` values per CompoundID."""
+    ids = df[["CompoundID", column]].dropna()
+    ids[column] = ids[column].astype(str).str.strip()
+    ids = ids[ids[column] != ""].drop_duplicates().sort_values(["CompoundID", column])
+    return ids.groupby("CompoundID", sort=False, observed=True)[column].agg(list)
 
 
 def aggregate_evidence(evidence: pd.DataFrame) -> pd.DataFrame:
@@ -86,65 +129,72 @@ def aggregate_evidence(evidence: pd.DataFrame) -> pd.DataFrame:
             ]
         )
 
-    df = evidence.copy()
-    df.replace({"": pd.NA}, inplace=True)
-    
     # Filter out rows without CompoundID (e.g., bgc_feature evidence type)
-    df = df[df["CompoundID"].notna()]
-    df = df[df["CompoundID"] != ""]
-
-    df["CompoundID"] = df["CompoundID"].apply(_sanitize_compound_id)
-    df = df[df["CompoundID"] != ""]
+    compound_ids = evidence["CompoundID"].astype("string").str.strip()
+    keep = (compound_ids.notna() & (compound_ids != "")).to_numpy()
+    # Slice only the columns aggregated below instead of copying the whole table;
+    # categorical keys let groupby work on integer codes
+    df = (
+        evidence.loc[keep, ["EvidenceScore", "BGCUID", "FeatureID"]]
+        .replace({"": pd.NA})
+        .assign(CompoundID=compound_ids[keep].astype("category"))
+    )
 
-    grouped = df.groupby("CompoundID", dropna=False)
+    grouped = df.groupby("CompoundID", observed=True)
 
     aggregated = grouped["EvidenceScore"].mean().to_frame(name="EvidenceScore")
     aggregated["EvidenceCount"] = grouped["EvidenceScore"].count()
-    aggregated["BGCUIDs"] = grouped["BGCUID"].apply(
-        lambda series: sorted({str(val) for val in series if pd.notna(val) and str(val).strip()})
-    )
-    aggregated["FeatureIDs"] = grouped["FeatureID"].apply(
-        lambda series: sorted({str(val) for val in series if pd.notna(val) and str(val).strip()})
-    )
+    aggregated = aggregated.join(_collect_unique_ids(df, "BGCUID").rename("BGCUIDs"))
+    aggregated = aggregated.join(_collect_unique_ids(df, "FeatureID").rename("FeatureIDs"))
+    for column in ("BGCUIDs", "FeatureIDs"):
+        aggregated[column] = [ids if isinstance(ids, list) else [] for ids in aggregated[column]]
 
     return aggregated.reset_index()
 
 
+def _linked_ids_by_bgc(evidence: pd.DataFrame, evidence_type: str, column: str) -> Dict[str, List[str]]:
+    """Map each BGCUID to the distinct ``column`` values of one evidence type."""
+    pairs = evidence.loc[evidence["EvidenceType"] == evidence_type, ["BGCUID", column]].astype("string")
+    # Strip the same way aggregate_evidence does so padded IDs join the same compound
+    pairs = (
+        pairs.apply(lambda ids: ids.str.strip())
+        .replace({"": pd.NA})
+        .dropna()
+        .drop_duplicates()
+    )
+    return pairs.groupby("BGCUID", sort=False)[column].agg(list).to_dict()
+
+
 def enrich_with_bgc_feature_links(evidence: pd.DataFrame, aggregated: pd.DataFrame) -> pd.DataFrame:
     if evidence.empty or aggregated.empty:
         return aggregated
 
-    df = evidence.copy()
-    df.replace({"": pd.NA}, inplace=True)
-
-    compound_bgc = (
-        df[df["EvidenceType"] == "bgc_compound"]
-        .dropna(subset=["CompoundID", "BGCUID"])
-        .groupby("BGCUID")["CompoundID"]
-        .unique()
-        .to_dict()
-    )
-
-    bgc_feature = (
-        df[df["EvidenceType"] == "bgc_feature"]
-        .dropna(subset=["BGCUID", "FeatureID"])
-        .groupby("BGCUID")["FeatureID"]
-        .unique()
-        .to_dict()
-    )
-
-    feature_links: Dict[str, Set[str]] = {row["CompoundID"]: set(row["FeatureIDs"]) for _, row in aggregated.iterrows()}
+    # Category codes turn both EvidenceType filters below into integer comparisons;
+    # a no-op when read_table already applied EVIDENCE_DTYPES
+    evidence = evidence.assign(EvidenceType=evidence["EvidenceType"].astype("category"))
+    compound_bgc = _linked_ids_by_bgc(evidence, "bgc_compound", "CompoundID")
+    bgc_feature = _linked_ids_by_bgc(evidence, "bgc_feature", "FeatureID")
 
+    # Only compounds reached through a BGC link need their features re-sorted;
+    # the rest keep the already sorted, de-duplicated lists from aggregation
+    extra_links: Dict[str, Set[str]] = {}
     for bgc_uid, features in bgc_feature.items():
         compounds = compound_bgc.get(bgc_uid, [])
         for compound in compounds:
-            feature_links.setdefault(compound, set()).update(str(f) for f in features)
+            extra_links.setdefault(compound, set()).update(str(f) for f in features)
+    if not extra_links:
+        return aggregated
 
-    aggregated = aggregated.copy()
-    aggregated["FeatureIDs"] = aggregated["CompoundID"].map(
-        lambda cid: sorted(feature_links.get(cid, set()))
+    compound_ids = aggregated["CompoundID"].to_numpy()
+    feature_ids = aggregated["FeatureIDs"].to_numpy()
+    sorted_links = {
+        cid: sorted(extra_links[cid].union(fids))
+        for cid, fids in zip(compound_ids, feature_ids)
+        if cid in extra_links
+    }
+    return aggregated.assign(
+        FeatureIDs=[sorted_links.get(cid, fids) for cid, fids in zip(compound_ids, feature_ids)]
     )
-    return aggregated
 
 
 def join_metadata(
@@ -152,44 +202,107 @@ def join_metadata(
     admet: pd.DataFrame,
     clusters: pd.DataFrame,
 ) -> pd.DataFrame:
-    result = ranking.merge(admet, on="CompoundID", how="left", suffixes=('', '_admet'))
-    clusters_unique = clusters.drop_duplicates("CompoundID") if not clusters.empty else clusters
-    result = result.merge(clusters_unique, on="CompoundID", how="left")
+    # One index-aligned concat instead of two sequential hash joins
+    admet_i = admet.drop_duplicates("CompoundID").set_index("CompoundID")
+    admet_i = admet_i.rename(columns={col: f"{col}_admet" for col in admet_i.columns if col in ranking.columns})
+    clusters_i = (
+        clusters.drop_duplicates("CompoundID").set_index("CompoundID")
+        if not clusters.empty
+        else pd.DataFrame(columns=[col for col in clusters.columns if col != "CompoundID"])
+    )
+    taken = set(ranking.columns) | set(admet_i.columns)
+    clusters_i = clusters_i.rename(columns={col: f"{col}_cluster" for col in clusters_i.columns if col in taken})
+    side = pd.concat([admet_i, clusters_i], axis=1).reindex(ranking["CompoundID"].astype(str).to_numpy())
+    result = pd.concat([ranking.reset_index(drop=True), side.reset_index(drop=True)], axis=1)
     if "ClusterSize" not in result.columns:
         result["ClusterSize"] = pd.NA
-    result["Novelty"] = result["ClusterSize"].apply(lambda size: 1.0 / size if isinstance(size, (int, float)) and size and size > 0 else 1.0)
+    sizes = pd.to_numeric(result["ClusterSize"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.isfinite(sizes) & (sizes > 0)
+    result["Novelty"] = np.divide(1.0, sizes, out=np.ones_like(sizes), where=valid)
     
     # Use QED as ADMET Score for better discrimination (0-1 continuous value)
     # QED > 0.67 is drug-like, 0.5-0.67 is moderate, < 0.5 is poor
-    result["ADMETScore"] = result["QED"].fillna(0.5)
+    qed = result["QED"] if "QED" in result.columns else pd.Series(np.nan, index=result.index)
+    result["ADMETScore"] = qed.fillna(0.5)
     
     return result
 
 
+def _weighted_sum_numpy(ev, ad, nv, w1, w2, w3, out):
+    np.multiply(ev, w1, out=out)
+    out += w2 * ad
+    out += w3 * nv
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_weighted_sum():
+    """Compile the parallel kernel on first use; ``None`` when Numba is unavailable."""
+    try:
+        from numba import njit, prange
+    except ImportError:  # pragma: no cover - Numba optional, NumPy fallback
+        return None
+
+    # Numba pickles the defining module name into its on-disk cache, so only
+    # persist it for CLI runs (always "__main__").
+    @njit(parallel=True, cache=__name__ == "__main__")
+    def _weighted_sum(ev, ad, nv, w1, w2, w3, out):  # pragma: no cover - compiled
+        for i in prange(out.size):
+            out[i] = w1 * ev[i] + w2 * ad[i] + w3 * nv[i]
+
+    return _weighted_sum
+
+
+def _weighted_sum_kernel(n_rows: int):
+    if n_rows >= NUMBA_MIN_ROWS:
+        kernel = _numba_weighted_sum()
+        if kernel is not None:
+            return kernel
+    return _weighted_sum_numpy
+
+
 def compute_scores(df: pd.DataFrame, weights: Dict[str, float]) -> pd.DataFrame:
     w1 = float(weights.get("evidence", 0.6))
     w2 = float(weights.get("admet", 0.3))
     w3 = float(weights.get("novelty", 0.1))
 
-    df = df.copy()
-    df["EvidenceScore"].fillna(0.0, inplace=True)
-    df["AggregateScore"] = (
-        w1 * df["EvidenceScore"].astype(float)
-        + w2 * df["ADMETScore"].astype(float)
-        + w3 * df["Novelty"].astype(float)
-    )
-    df.sort_values("AggregateScore", ascending=False, inplace=True)
-    df.reset_index(drop=True, inplace=True)
-    df["Rank"] = df.index + 1
-    df["BGCUIDs"] = df["BGCUIDs"].apply(lambda values: "|".join(values) if isinstance(values, list) else "")
-    df["FeatureIDs"] = df["FeatureIDs"].apply(lambda values: "|".join(values) if isinstance(values, list) else "")
-    df["EvidenceSummary"] = df["EvidenceCount"].apply(lambda c: f"{int(c)} evidence links" if pd.notna(c) else "0 evidence links")
+    evidence = df["EvidenceScore"].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    np.nan_to_num(evidence, copy=False, nan=0.0)
+    admet = df["ADMETScore"].to_numpy(dtype=np.float64)
+    novelty = df["Novelty"].to_numpy(dtype=np.float64)
+    scores = np.empty(len(df), dtype=np.float64)
+    _weighted_sum_kernel(len(df))(evidence, admet, novelty, w1, w2, w3, scores)
+    # Order on the score array alone, then reorder the frame once; the take
+    # builds the output frame so the caller's frame is never copied or mutated.
+    # The written table stays in rank order: the report and figures read its
+    # leading rows as the Top-N, so consumers only ever need head().
+    order = np.argsort(-scores, kind="stable")
+    df = df.take(order).reset_index(drop=True)
+    df["EvidenceScore"] = evidence[order]
+    df["AggregateScore"] = scores[order]
+    df["Rank"] = np.arange(1, len(df) + 1)
+    for column in ("BGCUIDs", "FeatureIDs"):
+        df[column] = ["|".join(values) if isinstance(values, list) else "" for values in df[column].to_numpy()]
+    counts = df["EvidenceCount"].to_numpy(dtype=np.float64, na_value=np.nan)
+    df["EvidenceSummary"] = [
+        f"{int(c)} evidence links" if not np.isnan(c) else "0 evidence links" for c in counts
+    ]
     return df
 
 
+def _write_csv_and_parquet(df: pd.DataFrame, output_csv: Path) -> None:
+    """Write ``df`` as CSV plus a zstd Parquet sibling, formatted in C++ by pyarrow."""
+    if not _HAS_PYARROW:
+        df.to_csv(output_csv, index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, str(output_csv))
+    # Written after the CSV so readers preferring the sibling see it as current
+    pq.write_table(table, str(output_csv.with_suffix(".parquet")), compression="zstd")
+
+
 def write_outputs(df: pd.DataFrame, output_csv: Path, topn_md: Path, top_n: int) -> None:
     output_csv.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_csv, index=False)
+    _write_csv_and_parquet(df, output_csv)
     logger.info("Wrote ranked candidates to %s", output_csv)
 
     topn_md.parent.mkdir(parents=True, exist_ok=True)
@@ -234,7 +347,7 @@ def main(argv: List[str] | None = None) -> None:
         format=logging_config.get("format", "%(levelname)s - %(message)s"),
     )
 
-    evidence = read_table(args.evidence_path)
+    evidence = read_table(args.evidence_path, columns=EVIDENCE_COLUMNS, dtype=EVIDENCE_DTYPES)
     admet = read_table(args.admet_path)
     clusters = read_table(args.cluster_path)
 
@@ -8,7 +8,7 @@
   - methods_template: Markdown 模板（如 REPORT_METHODS.md）。
   - topn_md: Top-N Markdown 摘要。
   - figures_dir: 图表目录。
-  - ranking_path: 排名 CSV。
+  - ranking_path: 排名 CSV（若存在较新的同名 .parquet 则优先读取）。
   - output_pdf: 目标 PDF 路径（若无法创建 PDF，回退至 Markdown）。
   - metadata_path: 可选运行元数据 JSON。
 
@@ -16,6 +16,7 @@
   - report/report.pdf 或 report/report.md（回退）。
 
 主要功能 / Key Functions:
+  - read_ranking_excerpt(...): 仅读取排名表前 10 行的摘要列。
   - compose_markdown(...): 拼接 Markdown 内容。
   - export_pdf(...): 尝试使用 FPDF 生成 PDF；若失败，返回 False。
 
@@ -35,6 +36,13 @@ from typing import Optional
 
 import pandas as pd
 
+try:  # pragma: no cover - pyarrow optional, CSV fallback
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover
+    pq = None  # type: ignore
+    _HAS_PYARROW = False
+
 try:  # pragma: no cover - optional dependency
     from fpdf import FPDF  # type: ignore
     _HAS_FPDF = True
@@ -44,6 +52,9 @@ except ImportError:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+RANKING_EXCERPT_COLUMNS = ["Rank", "CompoundID", "AggregateScore", "ADMETScore", "EvidenceScore", "BGCUIDs"]
+RANKING_EXCERPT_ROWS = 10
+
 
 def load_text(path: Path) -> str:
     if not path.exists():
@@ -52,6 +63,37 @@ def load_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def _prefer_parquet(path: Path) -> Path:
+    """Return an up-to-date sibling ``.parquet`` for a CSV/TSV path, if one exists."""
+    if path.suffix not in {".csv", ".tsv"}:
+        return path
+    sibling = path.with_suffix(".parquet")
+    if sibling.exists() and (not path.exists() or sibling.stat().st_mtime >= path.stat().st_mtime):
+        logger.debug("Using Parquet sibling %s instead of %s", sibling, path)
+        return sibling
+    return path
+
+
+def read_ranking_excerpt(ranking_path: Path) -> pd.DataFrame:
+    """Read only the leading excerpt rows and columns of the ranking table."""
+    source = _prefer_parquet(ranking_path) if _HAS_PYARROW else ranking_path
+    if source.suffix == ".parquet":
+        parquet = pq.ParquetFile(source)
+        columns = [col for col in RANKING_EXCERPT_COLUMNS if col in parquet.schema_arrow.names]
+        # The first batch only touches the leading row group
+        batch = next(parquet.iter_batches(batch_size=RANKING_EXCERPT_ROWS, columns=columns), None)
+        if batch is None:
+            return pd.DataFrame(columns=columns)
+        return batch.to_pandas()
+
+    ranking_df = pd.read_csv(
+        source,
+        usecols=lambda col: col in RANKING_EXCERPT_COLUMNS,
+        nrows=RANKING_EXCERPT_ROWS,
+    )
+    return ranking_df[[col for col in RANKING_EXCERPT_COLUMNS if col in ranking_df.columns]]
+
+
 def compose_markdown(
     methods_template: Path,
     topn_md: Path,
@@ -70,13 +112,13 @@ def compose_markdown(
         figures_summary.append("- (No figures generated)")
 
     ranking_excerpt = ""
-    if ranking_path.exists():
-        ranking_df = pd.read_csv(ranking_path)
+    if ranking_path.exists() or _prefer_parquet(ranking_path).exists():
+        ranking_df = read_ranking_excerpt(ranking_path)
         if not ranking_df.empty:
             try:
-                ranking_excerpt = ranking_df.head(10).to_markdown(index=False)
+                ranking_excerpt = ranking_df.to_markdown(index=False)
             except (ImportError, RuntimeError):
-                ranking_excerpt = ranking_df.head(10).to_string(index=False)
+                ranking_excerpt = ranking_df.to_string(index=False)
 
     metadata = {}
     if metadata_path and metadata_path.exists():
@@ -117,9 +159,9 @@ def export_pdf(markdown: str, output_pdf: Path) -> bool:
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
     pdf.set_font("Arial", size=12)
-    for line in markdown.splitlines():
-        safe_line = line.encode('latin-1', 'replace').decode('latin-1')
-        pdf.multi_cell(0, 8, safe_line)
+    # Sanitize once and let multi_cell wrap on the embedded newlines
+    safe_text = "\n".join(markdown.splitlines()).encode('latin-1', 'replace').decode('latin-1')
+    pdf.multi_cell(0, 8, safe_text)
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
     pdf.output(str(output_pdf))
     logger.info("Wrote PDF report to %s", output_pdf)
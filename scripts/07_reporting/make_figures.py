@@ -32,7 +32,17 @@ from typing import Dict
 
 import pandas as pd
 
+try:  # pragma: no cover - pyarrow optional, pandas writer fallback
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover
+    pa = pacsv = None  # type: ignore
+    _HAS_PYARROW = False
+
 try:  # pragma: no cover - Matplotlib optional
+    import matplotlib
+    matplotlib.use('Agg')  # headless: figures are only written to disk
     import matplotlib.pyplot as plt
     _HAS_MPL = True
 except ImportError:  # pragma: no cover
@@ -41,18 +51,36 @@ except ImportError:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Only these ranking columns are used by the figures
+RANKING_COLUMNS = ['Rank', 'CompoundID', 'AggregateScore']
+
+
+def _prefer_parquet(path: Path) -> Path:
+    """Return an up-to-date sibling ``.parquet`` for a CSV/TSV path, if one exists."""
+    if path.suffix not in {'.csv', '.tsv'}:
+        return path
+    sibling = path.with_suffix('.parquet')
+    if sibling.exists() and (not path.exists() or sibling.stat().st_mtime >= path.stat().st_mtime):
+        logger.debug("Using Parquet sibling %s instead of %s", sibling, path)
+        return sibling
+    return path
+
 
 def load_tables(ranking_path: Path, cluster_path: Path) -> Dict[str, pd.DataFrame]:
+    ranking_path = _prefer_parquet(ranking_path)
     if not ranking_path.exists():
         raise FileNotFoundError(f"Ranking file not found: {ranking_path}")
-    ranking = pd.read_csv(ranking_path)
+    if ranking_path.suffix == '.parquet':
+        ranking = pd.read_parquet(ranking_path, columns=RANKING_COLUMNS, engine='pyarrow', pre_buffer=True)
+    else:
+        ranking = pd.read_csv(ranking_path, usecols=RANKING_COLUMNS)
 
     if not cluster_path.exists():
         logger.warning("Cluster file not found: %s", cluster_path)
         clusters = pd.DataFrame()
     else:
         if cluster_path.suffix == '.parquet':
-            clusters = pd.read_parquet(cluster_path)
+            clusters = pd.read_parquet(cluster_path, engine='pyarrow', pre_buffer=True)
         else:
             sep = ',' if cluster_path.suffix == '.csv' else '\t'
             clusters = pd.read_csv(cluster_path, sep=sep)
@@ -69,16 +97,17 @@ def generate_top_scores_plot(ranking: pd.DataFrame, output_dir: Path, top_n: int
         return path
 
     if _HAS_MPL:
-        plt.figure(figsize=(8, 4))
-        plt.bar(subset['CompoundID'].astype(str), subset['AggregateScore'])
-        plt.xlabel('CompoundID')
-        plt.ylabel('Aggregate Score')
-        plt.title(f'Top {top_n} Aggregate Scores')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.bar(subset['CompoundID'].astype(str), subset['AggregateScore'])
+        ax.set_xlabel('CompoundID')
+        ax.set_ylabel('Aggregate Score')
+        ax.set_title(f'Top {top_n} Aggregate Scores')
+        ax.tick_params(axis='x', labelrotation=45)
+        plt.setp(ax.get_xticklabels(), ha='right')
+        fig.tight_layout()
         plot_path = output_dir / 'top_scores.png'
-        plt.savefig(plot_path, dpi=150)
-        plt.close()
+        fig.savefig(plot_path, dpi=100)
+        plt.close(fig)
         logger.info("Saved bar chart to %s", plot_path)
         return plot_path
 
@@ -105,7 +134,10 @@ def summarize_clusters(clusters: pd.DataFrame, output_dir: Path) -> Path:
         .sort_values('MemberCount', ascending=False)
     )
     summary_path = output_dir / 'cluster_sizes.csv'
-    summary.to_csv(summary_path, index=False)
+    if _HAS_PYARROW:
+        pacsv.write_csv(pa.Table.from_pandas(summary, preserve_index=False), str(summary_path))
+    else:
+        summary.to_csv(summary_path, index=False)
     logger.info("Wrote cluster summary to %s", summary_path)
     return summary_path
 
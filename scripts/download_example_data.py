@@ -26,7 +26,9 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Tuple
@@ -46,6 +48,8 @@ class ResourceMapping:
 
 BUNDLE_ROOT_DEFAULT = Path(__file__).resolve().parents[1] / "data" / "example_bundle"
 TARGET_ROOT_DEFAULT = Path(__file__).resolve().parents[1] / "data"
+MAX_COPY_WORKERS = 8
+COPY_CHUNK_BYTES = 1 << 20
 
 RESOURCE_MAP: Tuple[ResourceMapping, ...] = (
     ResourceMapping(Path("genomes"), Path("genomes"), True, "Example genome FASTA files"),
@@ -60,6 +64,21 @@ FILE_MAP: Tuple[ResourceMapping, ...] = (
 )
 
 
+def _copy_file(src: str | Path, dest: str | Path) -> str | Path:
+    """Copy a regular file in-kernel via copy_file_range, falling back to copy2."""
+    if not hasattr(os, "copy_file_range") or os.stat(src).st_size == 0:
+        return shutil.copy2(src, dest)
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_BYTES) > 0:
+                pass
+    except OSError as exc:  # e.g. unsupported filesystem pair
+        logger.debug("copy_file_range failed for %s (%s); using shutil.copy2", src, exc)
+        return shutil.copy2(src, dest)
+    shutil.copystat(src, dest)
+    return dest
+
+
 def copy_resource(src: Path, dest: Path, force: bool) -> None:
     """Copy a file or directory, honoring the force flag."""
     if not src.exists():
@@ -71,18 +90,18 @@ def copy_resource(src: Path, dest: Path, force: bool) -> None:
         if dest.exists():
             if force:
                 shutil.rmtree(dest)
-                shutil.copytree(src, dest)
+                shutil.copytree(src, dest, copy_function=_copy_file)
             else:
-                shutil.copytree(src, dest, dirs_exist_ok=True)
+                shutil.copytree(src, dest, dirs_exist_ok=True, copy_function=_copy_file)
         else:
-            shutil.copytree(src, dest)
+            shutil.copytree(src, dest, copy_function=_copy_file)
     else:
         if dest.exists():
             if not force:
                 logger.info("Skipping existing file: %s", dest)
                 return
             dest.unlink()
-        shutil.copy2(src, dest)
+        _copy_file(src, dest)
 
     logger.info("Copied %s -> %s", src, dest)
 
@@ -108,15 +127,15 @@ def deploy_bundle(bundle_root: Path, target_root: Path, force: bool = False) ->
             f"Bundle directory not found: {bundle_root}. Please check the repository layout."
         )
 
-    for mapping in RESOURCE_MAP:
-        src = bundle_root / mapping.bundle_relative
-        dest = target_root / mapping.target_relative
-        copy_resource(src, dest, force=force)
-
-    for mapping in FILE_MAP:
-        src = bundle_root / mapping.bundle_relative
-        dest = target_root / mapping.target_relative
-        copy_resource(src, dest, force=force)
+    tasks = [
+        (bundle_root / mapping.bundle_relative, target_root / mapping.target_relative)
+        for mapping in RESOURCE_MAP + FILE_MAP
+    ]
+    # Copies are I/O-bound and target disjoint paths, so overlap them
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(tasks))) as executor:
+        futures = [executor.submit(copy_resource, src, dest, force) for src, dest in tasks]
+        for future in futures:
+            future.result()
 
     metadata = load_metadata(bundle_root)
     if metadata:
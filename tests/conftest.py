@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+文件用途 / Purpose:
+  - 中文：提供测试共享的 fixture，例如按路径缓存的脚本模块加载器、默认配置。
+  - English: Shared test fixtures, e.g. a per-session cached loader for script modules and the default config.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict
+
+import pytest
+import yaml
+
+# Tests get the root through the project_root fixture, never by importing conftest
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+CONFIG_PATH = PROJECT_ROOT / "config" / "pipeline_defaults.yaml"
+
+
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    return PROJECT_ROOT
+
+
+@pytest.fixture(scope="session")
+def load_module() -> Callable[[Path, str], ModuleType]:
+    """Load a script by path once per session and register it in ``sys.modules``."""
+    cache: Dict[str, ModuleType] = {}
+
+    def _load(path: Path, name: str) -> ModuleType:
+        key = str(path)
+        if key not in cache:
+            spec = importlib.util.spec_from_file_location(name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load module from {path}")
+            module = importlib.util.module_from_spec(spec)
+            # dataclasses and pickling look the defining module up by name
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            cache[key] = module
+        return cache[key]
+
+    return _load
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Dict[str, Any]:
+    """Parse ``config/pipeline_defaults.yaml`` once for the whole session."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(CONFIG_PATH.read_text(encoding="utf-8"), Loader=loader)
+
@@ -11,22 +11,11 @@ from pathlib import Path
 
 import pandas as pd
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-MODULE_PATH = PROJECT_ROOT / "scripts" / "01_bgc_parse" / "unify_bgc.py"
+MODULE_RELPATH = Path("scripts") / "01_bgc_parse" / "unify_bgc.py"
 
 
-def _load_module():
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("unify_bgc", MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)  # type: ignore[attr-defined]
-    return module
-
-
-def test_merge_overlaps_reciprocal_threshold() -> None:
-    mod = _load_module()
+def test_merge_overlaps_reciprocal_threshold(load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "unify_bgc")
     data = pd.DataFrame(
         [
             {"SampleID": "S1", "Tool": "antismash", "ClusterIndex": 1, "ClusterType": "NRPS", "Start": 0, "End": 100, "Score": 80, "CoreEnzymes": ["a"], "MIBiGHits": [], "BGCID": "S1_antismash_1"},
@@ -44,8 +33,8 @@ def test_merge_overlaps_reciprocal_threshold() -> None:
     assert set(row["MIBiGHits"]) == {"X"}
 
 
-def test_merge_overlaps_below_threshold_retains_separate() -> None:
-    mod = _load_module()
+def test_merge_overlaps_below_threshold_retains_separate(load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "unify_bgc")
     data = pd.DataFrame(
         [
             {"SampleID": "S1", "Tool": "antismash", "ClusterIndex": 1, "ClusterType": "NRPS", "Start": 0, "End": 100, "Score": 80, "CoreEnzymes": ["a"], "MIBiGHits": [], "BGCID": "S1_antismash_1"},
@@ -58,8 +47,8 @@ def test_merge_overlaps_below_threshold_retains_separate() -> None:
     assert tools == {"antismash", "deepbgc"}
 
 
-def test_merge_overlaps_partial_overlap_requires_threshold() -> None:
-    mod = _load_module()
+def test_merge_overlaps_partial_overlap_requires_threshold(load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "unify_bgc")
     data = pd.DataFrame(
         [
             {"SampleID": "S1", "Tool": "antismash", "ClusterIndex": 1, "ClusterType": "NRPS", "Start": 0, "End": 100, "Score": 80, "CoreEnzymes": [], "MIBiGHits": [], "BGCID": "S1_antismash_1"},
@@ -11,22 +11,11 @@ from pathlib import Path
 
 import pandas as pd
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-MODULE_PATH = PROJECT_ROOT / "scripts" / "03_ref_load" / "load_chem_refs.py"
+MODULE_RELPATH = Path("scripts") / "03_ref_load" / "load_chem_refs.py"
 
 
-def _load_module():
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("chem_refs", MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)  # type: ignore[attr-defined]
-    return module
-
-
-def test_sanitize_references_drops_missing_smiles(tmp_path: Path) -> None:
-    mod = _load_module()
+def test_sanitize_references_drops_missing_smiles(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "chem_refs")
     df = pd.DataFrame(
         {
             "compound_id": ["C1", "C2"],
@@ -9,44 +9,68 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-FP_MODULE = PROJECT_ROOT / "scripts" / "05_cheminf" / "rdkit_fingerprints.py"
-CLUSTER_MODULE = PROJECT_ROOT / "scripts" / "05_cheminf" / "similarity_cluster.py"
-ADMET_MODULE = PROJECT_ROOT / "scripts" / "05_cheminf" / "admet_placeholder.py"
+FP_MODULE = Path("scripts") / "05_cheminf" / "rdkit_fingerprints.py"
+CLUSTER_MODULE = Path("scripts") / "05_cheminf" / "similarity_cluster.py"
+ADMET_MODULE = Path("scripts") / "05_cheminf" / "admet_placeholder.py"
+NETWORK_MODULE = Path("scripts") / "05_cheminf" / "build_molecular_network.py"
+LAYOUT_MODULE = Path("scripts") / "05_cheminf" / "visualize_network.py"
 
 
-def _load_module(path: Path, name: str):
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)  # type: ignore[attr-defined]
-    return module
-
-
-def test_fingerprint_hash_fallback(tmp_path: Path) -> None:
-    module = _load_module(FP_MODULE, "rdkit_fp")
+def test_fingerprint_hash_fallback(load_module, project_root: Path) -> None:
+    module = load_module(project_root / FP_MODULE, "rdkit_fp")
     chem_df = pd.DataFrame(
         {
             "CompoundID": ["C1", "C2"],
             "SMILES": ["CCO", "CCN"],
         }
     )
-    chem_path = tmp_path / "chem.csv"
-    chem_df.to_csv(chem_path, index=False)
-
     config = module.load_config(None)
     fp_df = module.compute_fingerprints(chem_df, radius=2, n_bits=256)
     assert fp_df.shape[0] == 2
-    assert all(len(fp) == 256 for fp in fp_df["Fingerprint"])
+    assert all(len(fp) * 8 == 256 for fp in fp_df["Fingerprint"])
+
 
 
-def test_similarity_cluster(tmp_path: Path) -> None:
-    fp_module = _load_module(FP_MODULE, "rdkit_fp")
-    cluster_module = _load_module(CLUSTER_MODULE, "cluster")
+def test_hash_fallback_without_rdkit(load_module, project_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = load_module(project_root / FP_MODULE, "rdkit_fp")
+    monkeypatch.setattr(module, "_HAS_RDKIT", False)
+    chem_df = pd.DataFrame(
+        {
+            "CompoundID": ["C1", "C2", "C3"],
+            "SMILES": ["CCO", "", "CCN"],
+        }
+    )
+    # Not a multiple of 8, so the packed bytes carry padding bits
+    n_bits = 100
+    first = module.compute_fingerprints(chem_df, radius=2, n_bits=n_bits)
+    second = module.compute_fingerprints(chem_df, radius=2, n_bits=n_bits)
+
+    assert first["CompoundID"].tolist() == ["C1", "C3"]
+    assert first.attrs["fingerprint_bits"] == n_bits
+    assert {len(fp) for fp in first["Fingerprint"]} == {(n_bits + 7) // 8}
+    bits = module._unpack_fingerprints(first["Fingerprint"].tolist(), n_bits)
+    assert bits.shape == (2, n_bits)
+    assert bits.any(axis=1).all()
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_hash_pool_matches_serial(load_module, project_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = load_module(project_root / FP_MODULE, "rdkit_fp")
+    smiles = ["CCO", "CCN", "C", "CC", "CCC"]
+    serial = module._hash_fingerprint_matrix(smiles, 64)
+
+    # Force the pool path (a no-op where fork is unavailable, which is the serial fallback)
+    monkeypatch.setattr(module, "HASH_POOL_MIN_ROWS", 1)
+    monkeypatch.setattr(module.os, "cpu_count", lambda: 2)
+    np.testing.assert_array_equal(module._hash_fingerprint_matrix(smiles, 64), serial)
+
+def test_similarity_cluster(tmp_path: Path, load_module, project_root: Path) -> None:
+    fp_module = load_module(project_root / FP_MODULE, "rdkit_fp")
+    cluster_module = load_module(project_root / CLUSTER_MODULE, "cluster")
 
     df = pd.DataFrame(
         {
@@ -56,23 +80,76 @@ def test_similarity_cluster(tmp_path: Path) -> None:
     )
     fp_df = fp_module.compute_fingerprints(df, radius=2, n_bits=32)
     fp_path = tmp_path / "fp.csv"
-    fp_df.to_csv(fp_path, index=False)
+    fp_module.write_output(fp_df, fp_path)
+    loaded = cluster_module.load_fingerprints(fp_path)
+
+    np.testing.assert_array_equal(
+        cluster_module.fingerprints_to_words(loaded["Fingerprint"].tolist()),
+        cluster_module.fingerprints_to_words(fp_df["Fingerprint"].tolist()),
+    )
+
+    cluster_df = cluster_module.cluster_fingerprints(loaded, threshold=0.8)
+    assert cluster_df.attrs.get("n_clusters", cluster_df["ClusterID"].nunique()) <= 3
 
-    cluster_df = cluster_module.cluster_fingerprints(fp_df, threshold=0.8)
-    assert cluster_df["ClusterID"].nunique() <= 3
 
 
-def test_admet_placeholder(tmp_path: Path) -> None:
-    module = _load_module(ADMET_MODULE, "admet")
+def test_tiled_tanimoto_matches_brute_force(load_module, project_root: Path) -> None:
+    pytest.importorskip("rdkit")
+    pytest.importorskip("networkx")
+    module = load_module(project_root / NETWORK_MODULE, "build_network")
+    rng = np.random.default_rng(0)
+    # More rows than one tile, plus an empty fingerprint (union 0)
+    bits = (rng.random((37, 128)) < 0.2).astype(np.uint8)
+    bits[5] = 0
+    packed = np.packbits(bits, axis=1).view(np.uint64)
+
+    expected = np.zeros((len(bits), len(bits)))
+    for i in range(len(bits)):
+        for j in range(len(bits)):
+            union = np.count_nonzero(bits[i] | bits[j])
+            expected[i, j] = np.count_nonzero(bits[i] & bits[j]) / union if union else 0.0
+
+    np.testing.assert_allclose(module.tanimoto_matrix_tiled(packed, block_size=8), expected)
+
+
+def test_eigenvector_is_zero_outside_giant_component(load_module, project_root: Path) -> None:
+    pytest.importorskip("rdkit")
+    nx = pytest.importorskip("networkx")
+    module = load_module(project_root / NETWORK_MODULE, "build_network")
+    G = nx.Graph([("A", "B"), ("B", "C"), ("C", "A"), ("D", "E")])
+    G.add_node("F")
+
+    metrics = module.calculate_centrality_metrics(G).set_index("CompoundID")
+
+    assert metrics.loc[["D", "E", "F"], "Eigenvector"].tolist() == [0.0, 0.0, 0.0]
+    np.testing.assert_allclose(metrics.loc[["A", "B", "C"], "Eigenvector"], 3 ** -0.5)
+
+
+def test_layout_cache_round_trip(tmp_path: Path, load_module, project_root: Path) -> None:
+    nx = pytest.importorskip("networkx")
+    pytest.importorskip("matplotlib")
+    module = load_module(project_root / LAYOUT_MODULE, "visualize_network")
+    G = nx.path_graph(["C1", "C2", "C3"])
+    cache_path = tmp_path / "network.spring.layout.json"
+
+    pos = module.compute_layout(G, "spring", cache_path)
+    assert cache_path.exists()
+    # A different algorithm still returns the cached positions for the same nodes
+    cached = module.compute_layout(G, "circular", cache_path)
+    assert cached == {node: tuple(xy) for node, xy in pos.items()}
+
+    # Different node set: the cache is stale and gets rewritten
+    G.add_node("C4")
+    assert set(module.compute_layout(G, "spring", cache_path)) == {"C1", "C2", "C3", "C4"}
+
+def test_admet_placeholder(tmp_path: Path, load_module, project_root: Path) -> None:
+    module = load_module(project_root / ADMET_MODULE, "admet")
     chem_df = pd.DataFrame(
         {
             "CompoundID": ["C1", "C2"],
             "SMILES": ["CCO", "CCCCCCCC"],
         }
     )
-    chem_path = tmp_path / "chem.csv"
-    chem_df.to_csv(chem_path, index=False)
-
-    admet_df = module.build_admet_table(chem_path, tmp_path / "admet.csv", None, None)
+    admet_df = module.build_admet_table(chem_df, tmp_path / "admet.csv", None, None)
     assert {"CompoundID", "logP", "RuleOfFivePass"}.issubset(admet_df.columns)
     assert admet_df.shape[0] == 2
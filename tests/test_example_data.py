@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+文件用途 / Purpose:
+  - 中文：测试示例数据部署时的文件复制逻辑。
+  - English: Test the file copy used when deploying the example data bundle.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+MODULE_RELPATH = Path("scripts") / "download_example_data.py"
+
+
+def test_copy_file_spans_multiple_chunks(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "download_example_data")
+    src = tmp_path / "features.bin"
+    dest = tmp_path / "copy.bin"
+    payload = os.urandom(2 * mod.COPY_CHUNK_BYTES + 123)
+    src.write_bytes(payload)
+    os.utime(src, (1_000, 1_000))
+
+    mod._copy_file(src, dest)
+
+    assert dest.read_bytes() == payload
+    assert dest.stat().st_mtime == src.stat().st_mtime
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+文件用途 / Purpose:
+  - 中文：验证各脚本中逐字复制的 I/O 小工具保持一致且行为正确。
+  - English: Check that the I/O helpers copied verbatim into standalone scripts stay identical and behave correctly.
+
+与其他模块的联系 / Relations to Other Modules:
+  - _read_delimited: parse_deepbgc.py、parse_prism.py、normalize_ms_features.py。
+  - _prefer_parquet: rank_candidates.py、build_report.py、make_figures.py。
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, List
+
+import pandas as pd
+import pytest
+
+READ_DELIMITED_SCRIPTS = [
+    ("01_bgc_parse/parse_deepbgc.py", "parse_deepbgc"),
+    ("01_bgc_parse/parse_prism.py", "parse_prism"),
+    ("02_ms_process/normalize_ms_features.py", "normalize_ms"),
+]
+PREFER_PARQUET_SCRIPTS = [
+    ("06_ranking/rank_candidates.py", "rank_candidates"),
+    ("07_reporting/build_report.py", "build_report"),
+    ("07_reporting/make_figures.py", "make_figures"),
+]
+
+
+def _modules(
+    scripts_dir: Path, load_module: Callable[[Path, str], ModuleType], scripts: List[tuple]
+) -> List[ModuleType]:
+    return [load_module(scripts_dir / rel, name) for rel, name in scripts]
+
+
+def _normalized_source(obj: object) -> str:
+    # AST dump ignores quote style, so make_figures' single quotes still compare equal
+    return ast.dump(ast.parse(inspect.getsource(obj)))
+
+
+@pytest.mark.parametrize(
+    ("helper", "scripts"),
+    [
+        ("_read_delimited", READ_DELIMITED_SCRIPTS),
+        ("_prefer_parquet", PREFER_PARQUET_SCRIPTS),
+    ],
+)
+def test_helper_copies_are_identical(helper: str, scripts: List[tuple], load_module, project_root: Path) -> None:
+    modules = _modules(project_root / "scripts", load_module, scripts)
+    assert len({_normalized_source(getattr(mod, helper)) for mod in modules}) == 1
+    if helper == "_read_delimited":
+        assert len({mod._NA_VALUES for mod in modules}) == 1
+
+
+@pytest.mark.parametrize(("rel", "name"), READ_DELIMITED_SCRIPTS)
+def test_read_delimited_matches_pandas_fallback(
+    rel: str, name: str, tmp_path: Path, load_module, monkeypatch: pytest.MonkeyPatch, project_root: Path
+) -> None:
+    mod = load_module(project_root / "scripts" / rel, name)
+    path = tmp_path / "table.tsv"
+    path.write_text("ID\tName\tvalue\nF1\tα-pinene\t1.5\nF2\tNA\t\nF3\tNone\tnan\n", encoding="utf-8")
+
+    arrow_df = mod._read_delimited(path, "\t")
+    monkeypatch.setattr(mod, "_HAS_PYARROW", False)
+    pandas_df = mod._read_delimited(path, "\t")
+
+    assert arrow_df["Name"].tolist()[0] == "α-pinene"
+    assert arrow_df["Name"].isna().tolist() == [False, True, True]
+    pd.testing.assert_frame_equal(arrow_df, pandas_df, check_dtype=False)
+
+
+@pytest.mark.parametrize(("rel", "name"), PREFER_PARQUET_SCRIPTS)
+def test_prefer_parquet_picks_fresh_sibling(
+    rel: str, name: str, tmp_path: Path, load_module, project_root: Path
+) -> None:
+    mod = load_module(project_root / "scripts" / rel, name)
+    csv_path = tmp_path / "ranked.csv"
+    parquet_path = tmp_path / "ranked.parquet"
+    csv_path.write_text("CompoundID\nC1\n", encoding="utf-8")
+    assert mod._prefer_parquet(csv_path) == csv_path
+
+    parquet_path.write_bytes(b"")
+    os.utime(csv_path, (1_000, 1_000))
+    os.utime(parquet_path, (2_000, 2_000))
+    assert mod._prefer_parquet(csv_path) == parquet_path
+    assert mod._prefer_parquet(parquet_path) == parquet_path
+
+    # A CSV rewritten after the Parquet sibling wins again
+    os.utime(csv_path, (3_000, 3_000))
+    assert mod._prefer_parquet(csv_path) == csv_path
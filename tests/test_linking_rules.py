@@ -11,22 +11,11 @@ from pathlib import Path
 
 import pandas as pd
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-MODULE_PATH = PROJECT_ROOT / "scripts" / "04_linking" / "link_bgc_ms_refs.py"
+MODULE_RELPATH = Path("scripts") / "04_linking" / "link_bgc_ms_refs.py"
 
 
-def _load_module():
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("linking", MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)  # type: ignore[attr-defined]
-    return module
-
-
-def test_build_mapping_generates_expected_evidence(tmp_path: Path) -> None:
-    mod = _load_module()
+def test_build_mapping_generates_expected_evidence(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "linking")
 
     bgc = pd.DataFrame(
         {
@@ -61,18 +50,73 @@ def test_build_mapping_generates_expected_evidence(tmp_path: Path) -> None:
         }
     )
 
-    bgc_path = tmp_path / "bgc.csv"
-    feature_path = tmp_path / "features.csv"
-    chem_path = tmp_path / "chem.csv"
     output_path = tmp_path / "evidence.csv"
 
-    bgc.to_csv(bgc_path, index=False)
-    features.to_csv(feature_path, index=False)
-    compounds.to_csv(chem_path, index=False)
-
     config = mod.load_config(None)
-    evidence = mod.build_mapping(bgc_path, feature_path, chem_path, output_path, config)
+    evidence = mod.build_mapping(bgc, features, compounds, output_path, config)
 
     evidence_types = set(evidence["EvidenceType"])
     assert {"bgc_compound", "feature_compound", "bgc_feature"}.issubset(evidence_types)
     assert output_path.exists()
+
+
+def test_missing_sample_ids_never_cooccur(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "linking")
+
+    # Mix both null spellings: None must not pair with None, nor with NaN
+    bgc = pd.DataFrame(
+        {
+            "BGCUID": ["B_NULL", "B_S1"],
+            "SampleID": pd.Series([None, "S1"], dtype=object),
+            "ClusterType": ["NRPS", "NRPS"],
+            "MIBiGHits": [[], []],
+        }
+    )
+    features = pd.DataFrame(
+        {
+            "FeatureID": ["F_NONE", "F_NAN", "F_S1"],
+            "SampleID": pd.Series([None, float("nan"), "S1"], dtype=object),
+            "mz": [500.0, 500.0, 500.0],
+            "intensity": [1000.0, 1000.0, 1000.0],
+            "intensity_normalized": [0.5, 0.5, 0.5],
+        }
+    )
+    compounds = pd.DataFrame({"CompoundID": [], "Source": [], "SMILES": []})
+
+    config = mod.load_config(None)
+    evidence = mod.build_mapping(bgc, features, compounds, tmp_path / "evidence.csv", config)
+
+    pairs = evidence.loc[evidence["EvidenceType"] == "bgc_feature", ["BGCUID", "FeatureID"]]
+    assert pairs.values.tolist() == [["B_S1", "F_S1"]]
+
+
+def test_evidence_ids_are_stripped(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "linking")
+
+    bgc = pd.DataFrame({"BGCUID": [" B1 "], "SampleID": ["S1"], "ClusterType": ["NRPS"], "MIBiGHits": [[]]})
+    features = pd.DataFrame(
+        {"FeatureID": [" F1"], "SampleID": ["S1"], "mz": [500.0], "intensity": [1000.0], "intensity_normalized": [0.5]}
+    )
+    compounds = pd.DataFrame({"CompoundID": [], "Source": [], "SMILES": []})
+
+    config = mod.load_config(None)
+    evidence = mod.build_mapping(bgc, features, compounds, tmp_path / "evidence.csv", config)
+
+    assert evidence[["BGCUID", "FeatureID"]].values.tolist() == [["B1", "F1"]]
+
+
+def test_normalized_only_features_link_without_raw_intensity(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "linking")
+
+    bgc = pd.DataFrame({"BGCUID": ["B1"], "SampleID": ["S1"], "ClusterType": ["NRPS"], "MIBiGHits": [[]]})
+    # No raw "intensity" column: a missing normalized value falls back to a zero score
+    features = pd.DataFrame(
+        {"FeatureID": ["F1", "F2"], "SampleID": ["S1", "S1"], "mz": [500.0, 500.0], "intensity_normalized": [0.5, None]}
+    )
+    compounds = pd.DataFrame({"CompoundID": [], "Source": [], "SMILES": []})
+
+    config = mod.load_config(None)
+    evidence = mod.build_mapping(bgc, features, compounds, tmp_path / "evidence.csv", config)
+
+    pairs = evidence.loc[evidence["EvidenceType"] == "bgc_feature", ["BGCUID", "FeatureID"]]
+    assert pairs.values.tolist() == [["B1", "F1"]]
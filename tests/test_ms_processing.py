@@ -13,22 +13,11 @@ import numpy as np
 import pandas as pd
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-MODULE_PATH = PROJECT_ROOT / "scripts" / "02_ms_process" / "normalize_ms_features.py"
+MODULE_RELPATH = Path("scripts") / "02_ms_process" / "normalize_ms_features.py"
 
 
-def _load_module():
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("normalize_ms", MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)  # type: ignore[attr-defined]
-    return module
-
-
-def test_tic_normalization(tmp_path: Path) -> None:
-    mod = _load_module()
+def test_tic_normalization(tmp_path: Path, load_module, project_root: Path) -> None:
+    mod = load_module(project_root / MODULE_RELPATH, "normalize_ms")
 
     df = pd.DataFrame(
         {
@@ -39,9 +28,6 @@ def test_tic_normalization(tmp_path: Path) -> None:
             "SampleID": ["S1", "S1", "S1"],
         }
     )
-    input_path = tmp_path / "features.csv"
-    df.to_csv(input_path, index=False)
-
     column_map = {
         "FeatureID": "row ID",
         "mz": "m/z",
@@ -50,13 +36,14 @@ def test_tic_normalization(tmp_path: Path) -> None:
         "SampleID": "SampleID",
     }
 
-    loaded = mod.load_features(input_path, column_map)
+    loaded = mod.load_features(df, column_map)
     processed = mod.clip_and_normalize(loaded, intensity_floor=10.0, method="tic")
     mod.validate_schema(processed)
 
     norm_values = processed["intensity_normalized"].tolist()
     assert sum(norm_values) == pytest.approx(1.0, rel=1e-6)
     assert all(value >= 0 for value in norm_values)
+    assert processed.attrs["tic_total"] == {"S1": pytest.approx(120.0)}
 
     raw_intensity = processed.loc[processed["FeatureID"] == "F2", "intensity_raw"].iloc[0]
     assert raw_intensity == -50.0
@@ -64,3 +51,16 @@ def test_tic_normalization(tmp_path: Path) -> None:
     output_path = tmp_path / "features.csv"
     mod.write_output(processed, output_path)
     assert output_path.exists()
+
+
+def test_polars_normalization_matches_numpy(load_module, project_root: Path) -> None:
+    pytest.importorskip("polars")
+    mod = load_module(project_root / MODULE_RELPATH, "normalize_ms")
+
+    intensity = np.array([100.0, -50.0, np.nan, 5.0, 0.0, 40.0])
+    sample_codes = np.array([0, 0, 0, 1, 2, 1])
+    expected = mod._clip_norm_numpy(intensity.copy(), sample_codes, 3, 10.0)
+    actual = mod._clip_norm_polars(intensity.copy(), sample_codes, 10.0)
+
+    for exp, act in zip(expected, actual):
+        np.testing.assert_allclose(act, exp)
@@ -8,10 +8,129 @@
   - 检查 scripts/06_ranking/rank_candidates.py 的核心逻辑。
 """
 
+from __future__ import annotations
+
+from types import ModuleType
+
+import pandas as pd
 import pytest
 
+WEIGHTS = {"evidence": 0.6, "admet": 0.3, "novelty": 0.1}
+
+
+@pytest.fixture
+def rank(project_root, load_module) -> ModuleType:
+    return load_module(project_root / "scripts" / "06_ranking" / "rank_candidates.py", "rank_candidates")
+
+
+def _evidence(rows: list) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["BGCUID", "FeatureID", "CompoundID", "EvidenceType", "EvidenceScore"])
+
+
+def _rank(rank: ModuleType, evidence: pd.DataFrame, admet: pd.DataFrame, clusters: pd.DataFrame) -> pd.DataFrame:
+    aggregated = rank.aggregate_evidence(evidence)
+    aggregated = rank.enrich_with_bgc_feature_links(evidence, aggregated)
+    return rank.compute_scores(rank.join_metadata(aggregated, admet, clusters), WEIGHTS)
+
+
+def test_padded_and_duplicate_compound_ids_aggregate_together(rank: ModuleType) -> None:
+    evidence = _evidence(
+        [
+            ["B1", "", " C1", "bgc_compound", 0.8],
+            [" B1 ", "", "C1 ", "bgc_compound", 0.4],
+            ["", "F1", "C1", "feature_compound", 0.6],
+            ["B1", " F2", "", "bgc_feature", 0.3],
+        ]
+    )
+    aggregated = rank.enrich_with_bgc_feature_links(evidence, rank.aggregate_evidence(evidence))
+
+    assert aggregated["CompoundID"].tolist() == ["C1"]
+    row = aggregated.iloc[0]
+    assert row["EvidenceScore"] == pytest.approx(0.6)
+    assert row["EvidenceCount"] == 3
+    assert row["BGCUIDs"] == ["B1"]
+    # F2 arrives through the B1 -> C1 link despite the padding on both sides
+    assert row["FeatureIDs"] == ["F1", "F2"]
+
+
+def test_scores_match_hand_computed_table(rank: ModuleType) -> None:
+    evidence = _evidence(
+        [
+            ["B1", "", "C1", "bgc_compound", 0.8],
+            ["", "F1", "C1", "feature_compound", 0.4],
+            ["", "F2", "C2", "feature_compound", 0.5],
+        ]
+    )
+    admet = pd.DataFrame({"CompoundID": ["C1"], "QED": [0.7]})
+    clusters = pd.DataFrame({"CompoundID": ["C1"], "ClusterID": ["K1"], "ClusterSize": [2]})
+
+    ranked = _rank(rank, evidence, admet, clusters)
+
+    # C1: 0.6*0.6 + 0.3*0.7 + 0.1*(1/2) = 0.62; C2: 0.6*0.5 + 0.3*0.5 (QED default) + 0.1*1 = 0.55
+    expected = pd.DataFrame(
+        {
+            "Rank": [1, 2],
+            "CompoundID": ["C1", "C2"],
+            "EvidenceScore": [0.6, 0.5],
+            "ADMETScore": [0.7, 0.5],
+            "Novelty": [0.5, 1.0],
+            "AggregateScore": [0.62, 0.55],
+            "BGCUIDs": ["B1", ""],
+            "FeatureIDs": ["F1", "F2"],
+            "EvidenceSummary": ["2 evidence links", "1 evidence links"],
+        }
+    )
+    actual = ranked[expected.columns].astype({"CompoundID": str})
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_compound_without_scored_evidence_ranks_on_metadata(rank: ModuleType) -> None:
+    evidence = _evidence(
+        [
+            ["", "F1", "C1", "feature_compound", None],
+            ["", "F2", "C2", "feature_compound", 0.5],
+        ]
+    )
+    ranked = _rank(rank, evidence, pd.DataFrame({"CompoundID": ["C3"], "QED": [0.9]}), pd.DataFrame())
+
+    # C3 has metadata but no evidence, so it is not a candidate at all
+    assert sorted(ranked["CompoundID"].astype(str)) == ["C1", "C2"]
+    c1 = ranked.loc[ranked["CompoundID"] == "C1"].iloc[0]
+    assert c1["EvidenceScore"] == 0.0
+    assert c1["EvidenceSummary"] == "0 evidence links"
+    assert c1["AggregateScore"] == pytest.approx(0.3 * 0.5 + 0.1 * 1.0)
+
+
+def test_missing_metadata_columns_fall_back_to_defaults(rank: ModuleType) -> None:
+    evidence = _evidence([["", "F1", "C1", "feature_compound", 0.5]])
+    # No QED in the ADMET table and no ClusterSize anywhere
+    admet = pd.DataFrame({"CompoundID": ["C1"], "MW": [46.07]})
+    clusters = pd.DataFrame({"CompoundID": ["C1"], "ClusterID": ["K1"]})
+
+    ranked = _rank(rank, evidence, admet, clusters)
+
+    row = ranked.iloc[0]
+    assert row["ADMETScore"] == 0.5
+    assert row["Novelty"] == 1.0
+    assert row["AggregateScore"] == pytest.approx(0.6 * 0.5 + 0.3 * 0.5 + 0.1)
+
+
+def test_ties_keep_input_order_and_head_is_top_n(rank: ModuleType) -> None:
+    frame = pd.DataFrame(
+        {
+            "CompoundID": ["C4", "C2", "C3", "C1"],
+            "EvidenceScore": [0.5, 0.9, 0.5, 0.5],
+            "ADMETScore": [0.5, 0.5, 0.5, 0.5],
+            "Novelty": [1.0, 1.0, 1.0, 1.0],
+            "EvidenceCount": [1, 1, 1, 1],
+            "BGCUIDs": [[], [], [], []],
+            "FeatureIDs": [[], [], [], []],
+        }
+    )
+    ranked = rank.compute_scores(frame, WEIGHTS)
 
-@pytest.mark.skip(reason="Ranking tests pending implementation")
-def test_placeholder_ranking() -> None:
-    """Placeholder ranking test."""
-    raise NotImplementedError
+    # Stable ordering: equal scores keep the order they arrived in
+    assert ranked["CompoundID"].tolist() == ["C2", "C4", "C3", "C1"]
+    assert ranked["Rank"].tolist() == [1, 2, 3, 4]
+    assert ranked.head(2)["CompoundID"].tolist() == ["C2", "C4"]
+    assert frame["EvidenceScore"].tolist() == [0.5, 0.9, 0.5, 0.5]